@@ -0,0 +1,128 @@
+# Adaptive_Segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#   Evaluate Adaptive
+# ----------------------------------------------------------------------
+
+def evaluate_adaptive(mission,minimum_points=5,maximum_points=64,tolerance=1e-5,
+                      outputs=('conditions.weights.total_mass','conditions.propulsion.battery_energy')):
+    """Evaluate a mission, refining the control points of each segment until it is resolved.
+
+    Every segment starts with minimum_points Chebyshev points. After each solve the unknowns
+    and outputs of every segment are fit with Chebyshev polynomials, and the size of the last
+    two coefficients, relative to the largest, estimates the discretization error. Segments
+    above tolerance, or that did not converge, are refined to 2n-1 points, which keeps the old
+    points, and start from their solution interpolated to the new points. Outputs a segment
+    does not have are skipped.
+
+    Pass a mission that has not been evaluated yet. Returns the results and the refined
+    mission, whose number_control_points can be copied into the setup.
+    """
+
+    template = deepcopy(mission)
+
+    points = Data()
+    for tag in template.segments.keys():
+        points[tag] = minimum_points
+
+    unknowns = None
+
+    while True:
+
+        trial = deepcopy(template)
+        for tag, segment in trial.segments.items():
+            segment.state.numerics.number_control_points = points[tag]
+            if unknowns is not None:
+                for key,value in unknowns[tag].items():
+                    segment.state.unknowns[key] = value
+
+        results  = trial.evaluate()
+        refined  = False
+        unknowns = Data()
+
+        for tag, segment in results.segments.items():
+            n = points[tag]
+            x = control_points(segment,n)
+
+            values = list(segment.unknowns.values())
+            for path in outputs:
+                try:
+                    values.append(get_path(segment,path))
+                except (KeyError,AttributeError):
+                    pass
+
+            error     = max([spectral_error(x,value) for value in values] + [0.])
+            converged = segment.numerics.get('converged',True)
+
+            if (error > tolerance or not converged) and n < maximum_points:
+                points[tag] = min(2*n - 1,maximum_points)
+                refined     = True
+
+            unknowns[tag] = Data()
+            for key,value in segment.unknowns.items():
+                unknowns[tag][key] = resample(x,value,points[tag])
+
+        if not refined:
+            return results, trial
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def control_points(segment,n):
+    """The dimensionless control points of a solved segment, from 0 to 1."""
+
+    try:
+        return np.asarray(segment.numerics.dimensionless.control_points)[:,0]
+    except (KeyError,AttributeError,IndexError):
+        return chebyshev_points(n)
+
+def chebyshev_points(n):
+
+    return 0.5*(1. - np.cos(np.pi*np.arange(n)/(n - 1)))
+
+def spectral_error(x,value):
+
+    value = np.asarray(value,dtype=float)
+    if value.ndim == 1:
+        value = value[:,None]
+    if value.ndim != 2 or value.shape[0] != len(x):
+        return 0.
+
+    coefficients = chebyshev.chebfit(2.*x - 1.,value,len(x) - 1)
+    largest      = np.max(np.abs(coefficients))
+    if largest == 0.:
+        return 0.
+
+    return np.max(np.abs(coefficients[-2:])) / largest
+
+def resample(x,value,n):
+
+    value = np.asarray(value,dtype=float)
+    if value.ndim != 2 or value.shape[0] != len(x) or n == len(x):
+        return value
+
+    coefficients = chebyshev.chebfit(2.*x - 1.,value,len(x) - 1)
+
+    return chebyshev.chebval(2.*chebyshev_points(n) - 1.,coefficients).T
+
+def get_path(data,path):
+
+    for key in path.split('.'):
+        data = data[key]
+
+    return data
@@ -0,0 +1,273 @@
+# Airfoil_Polars.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import json
+import hashlib
+import importlib
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import compute_airfoil_polars
+
+from Cache_Tools import atomic_write, file_hash
+
+# ----------------------------------------------------------------------
+#   Use Polar Cache
+# ----------------------------------------------------------------------
+
+def use_polar_cache(cache_directory='polar_cache'):
+    """Make propeller_design and compute_airfoil_polars read the XFOIL polars through the cache.
+
+    Call this once before the rotors are designed. Every polar file is then parsed only the
+    first time it is seen, by any process, and read back as a memory map afterwards.
+    """
+
+    def cached_import_airfoil_polars(airfoil_polar_files):
+        return import_airfoil_polars(airfoil_polar_files,cache_directory)
+
+    # the package __init__ files shadow these modules with their functions, so go through importlib
+    airfoil = 'SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.'
+    for name in ['compute_airfoil_polars','import_airfoil_polars']:
+        module = importlib.import_module(airfoil + name)
+        module.import_airfoil_polars = cached_import_airfoil_polars
+
+    return
+
+def import_airfoil_polars(airfoil_polar_files,cache_directory='polar_cache'):
+    """Read the polars of every airfoil, in the layout of SUAVE's import_airfoil_polars.
+
+    The lift and drag of every polar are interpolated to a 0.25 deg grid from -6 to 16 deg.
+    """
+
+    num_airfoils = len(airfoil_polar_files)
+    num_polars   = 0
+    for files in airfoil_polar_files:
+        if len(files) < 3:
+            raise AttributeError('Provide three or more airfoil polars to compute surrogate')
+        num_polars = max(num_polars,len(files))
+
+    dim_aoa    = 89
+    AoA_interp = np.linspace(-6,16,dim_aoa)
+    CL         = np.zeros((num_airfoils,num_polars,dim_aoa))
+    CD         = np.zeros((num_airfoils,num_polars,dim_aoa))
+    Re         = np.zeros((num_airfoils,num_polars))
+    Ma         = np.zeros((num_airfoils,num_polars))
+
+    for i, files in enumerate(airfoil_polar_files):
+        for j, filename in enumerate(files):
+            polar    = load_polar(filename,cache_directory)
+            Re[i,j]  = polar.reynolds_number
+            Ma[i,j]  = polar.mach_number
+            CL[i,j]  = np.interp(AoA_interp,polar.angle_of_attack,polar.lift_coefficient)
+            CD[i,j]  = np.interp(AoA_interp,polar.angle_of_attack,polar.drag_coefficient)
+
+    airfoil_data = Data()
+    airfoil_data.angle_of_attacks  = AoA_interp
+    airfoil_data.reynolds_number   = Re
+    airfoil_data.mach_number       = Ma
+    airfoil_data.lift_coefficients = CL
+    airfoil_data.drag_coefficients = CD
+
+    return airfoil_data
+
+# ----------------------------------------------------------------------
+#   Load Polar
+# ----------------------------------------------------------------------
+
+# polars already loaded by this process, keyed by path
+_loaded = dict()
+
+def load_polar(filename,cache_directory='polar_cache'):
+    """Load one XFOIL polar, compiling it into the binary cache the first time.
+
+    The cache keeps one .npy of the columns per file content, read back as a memory map, and
+    one index per path with the modification time, size and hash of the text file. A newer
+    modification time only recompiles the polar if the hash of the file changed too.
+    Returns a Data of the Reynolds and Mach numbers and the alpha, CL, CD, CDp and CM arrays.
+    """
+
+    path  = os.path.abspath(filename)
+    stats = os.stat(path)
+    stamp = [stats.st_mtime_ns,stats.st_size]
+
+    if path in _loaded and _loaded[path][0] == stamp:
+        return _loaded[path][1]
+
+    os.makedirs(cache_directory,exist_ok=True)
+    index_file = os.path.join(cache_directory,hashlib.sha1(path.encode()).hexdigest() + '.json')
+
+    index = None
+    if os.path.exists(index_file):
+        try:
+            with open(index_file) as f:
+                index = json.load(f)
+        except (OSError,ValueError):
+            index = None
+
+    if index is not None and index['stamp'] != stamp:
+        if file_hash(path) == index['hash']:
+            # touched but not changed
+            index['stamp'] = stamp
+            with atomic_write(index_file) as f:
+                f.write(json.dumps(index).encode())
+        else:
+            index = None
+
+    data_file = None
+    if index is not None:
+        data_file = os.path.join(cache_directory,index['hash'] + '.npy')
+        if not os.path.exists(data_file):
+            index = None
+
+    if index is None:
+        reynolds_number, mach_number, columns = read_polar(path)
+        index = dict(stamp=stamp,hash=file_hash(path),reynolds_number=reynolds_number,mach_number=mach_number)
+
+        data_file = os.path.join(cache_directory,index['hash'] + '.npy')
+        with atomic_write(data_file) as f:
+            np.save(f,np.ascontiguousarray(columns.T))
+        with atomic_write(index_file) as f:
+            f.write(json.dumps(index).encode())
+
+    columns = np.load(data_file,mmap_mode='r')
+
+    polar = Data()
+    polar.reynolds_number           = index['reynolds_number']
+    polar.mach_number               = index['mach_number']
+    polar.angle_of_attack           = columns[0]
+    polar.lift_coefficient          = columns[1]
+    polar.drag_coefficient          = columns[2]
+    polar.pressure_drag_coefficient = columns[3]
+    polar.moment_coefficient        = columns[4]
+
+    _loaded[path] = (stamp,polar)
+
+    return polar
+
+def read_polar(filename):
+    """Parse an XFOIL polar text file into its Reynolds number, Mach number and columns."""
+
+    reynolds_number = 0.
+    mach_number     = 0.
+    rows            = []
+    in_data         = False
+
+    with open(filename) as f:
+        for line in f:
+            if in_data:
+                values = line.split()
+                if len(values) >= 5:
+                    rows.append([float(value) for value in values[:5]])
+            elif 'Re =' in line:
+                # e.g. Mach =   0.000     Re =     0.100 e 6     Ncrit =   9.000
+                mach_number     = float(line.split('Mach =')[1].split()[0])
+                mantissa, power = line.split('Re =')[1].split('Ncrit')[0].split('e')
+                reynolds_number = float(mantissa) * 10**float(power)
+            elif '---' in line:
+                in_data = True
+
+    return reynolds_number, mach_number, np.array(rows)
+
+# ----------------------------------------------------------------------
+#   Polar Table
+# ----------------------------------------------------------------------
+
+class Polar_Table(object):
+    """The lift and drag of one airfoil on a regular grid of angle of attack and log Reynolds number.
+
+    The table is sampled once from the surrogates of SUAVE's compute_airfoil_polars, so it
+    holds the same AERODAS post-stall extension over the same range of angles, up to 90 deg.
+    An evaluation then finds the cell of every point by index arithmetic and interpolates
+    bilinearly, so all blade stations of all control points are evaluated in one vectorized
+    call. Points outside the grid take the value at its edge.
+    """
+
+    def __init__(self,geometry_file,polar_files,number_of_angles=417,number_of_reynolds=41,cache_directory='polar_cache'):
+
+        airfoil_data   = compute_airfoil_polars([geometry_file],[polar_files])
+        lift_surrogate = airfoil_data.lift_coefficient_surrogates[geometry_file]
+        drag_surrogate = airfoil_data.drag_coefficient_surrogates[geometry_file]
+
+        alpha = np.linspace(np.min(airfoil_data.angle_of_attacks),np.max(airfoil_data.angle_of_attacks),number_of_angles)
+
+        reynolds_numbers = sorted([load_polar(filename,cache_directory).reynolds_number for filename in polar_files])
+        log_Re           = np.linspace(np.log(reynolds_numbers[0]),np.log(reynolds_numbers[-1]),number_of_reynolds)
+
+        Re_grid, alpha_grid = np.meshgrid(np.exp(log_Re),alpha,indexing='ij')
+
+        self.alpha_start  = alpha[0]
+        self.alpha_step   = alpha[1] - alpha[0]
+        self.log_Re_start = log_Re[0]
+        self.log_Re_step  = log_Re[1] - log_Re[0]
+        self.lift_table   = lift_surrogate(Re_grid,alpha_grid,grid=False)
+        self.drag_table   = drag_surrogate(Re_grid,alpha_grid,grid=False)
+
+        # the table must follow the surrogates past stall, at the Reynolds numbers of the polars
+        Re_check, alpha_check = np.meshgrid(reynolds_numbers,np.radians([20.,30.,45.,60.,80.]),indexing='ij')
+        CL, CD = self.evaluate(alpha_check,Re_check)
+        if not np.allclose(CL,lift_surrogate(Re_check,alpha_check,grid=False),rtol=0.02,atol=0.01):
+            raise ValueError('Polar_Table lift departs from the SUAVE surrogate, use more angles or Reynolds numbers')
+        if not np.allclose(CD,drag_surrogate(Re_check,alpha_check,grid=False),rtol=0.02,atol=0.01):
+            raise ValueError('Polar_Table drag departs from the SUAVE surrogate, use more angles or Reynolds numbers')
+
+    def evaluate(self,alpha,reynolds_number):
+        """Lift and drag coefficients at alpha, in radians, and the Reynolds number, of any shape."""
+
+        alpha           = np.asarray(alpha,dtype=float)
+        reynolds_number = np.asarray(reynolds_number,dtype=float)
+
+        i, u = self._cell((alpha - self.alpha_start) / self.alpha_step,self.lift_table.shape[1])
+        j, v = self._cell((np.log(np.maximum(reynolds_number,1.)) - self.log_Re_start) / self.log_Re_step,
+                          self.lift_table.shape[0])
+
+        CL = self._bilinear(self.lift_table,i,j,u,v)
+        CD = self._bilinear(self.drag_table,i,j,u,v)
+
+        return CL, CD
+
+    def surrogates(self):
+        """Lift and drag surrogates called like the splines a rotor holds: (Re, alpha, grid=False)."""
+
+        def lift(reynolds_number,alpha,grid=False):
+            return self.evaluate(alpha,reynolds_number)[0]
+
+        def drag(reynolds_number,alpha,grid=False):
+            return self.evaluate(alpha,reynolds_number)[1]
+
+        return lift, drag
+
+    def _cell(self,position,size):
+
+        position = np.clip(position,0.,size - 1.)
+        index    = np.minimum(position.astype(int),size - 2)
+
+        return index, position - index
+
+    def _bilinear(self,table,i,j,u,v):
+
+        return ((1. - v)*((1. - u)*table[j,i]   + u*table[j,i+1]) +
+                       v *((1. - u)*table[j+1,i] + u*table[j+1,i+1]))
+
+def use_polar_tables(rotor,cache_directory='polar_cache'):
+    """Swap the lift and drag surrogates of a designed rotor for Polar_Tables of its polars."""
+
+    cl_surrogates = rotor.get('airfoil_cl_surrogates',Data())
+    cd_surrogates = rotor.get('airfoil_cd_surrogates',Data())
+
+    for airfoil, polar_files in zip(rotor.airfoil_geometry,rotor.airfoil_polars):
+        lift, drag = Polar_Table(airfoil,polar_files,cache_directory=cache_directory).surrogates()
+        cl_surrogates[airfoil] = lift
+        cd_surrogates[airfoil] = drag
+
+    rotor.airfoil_cl_surrogates = cl_surrogates
+    rotor.airfoil_cd_surrogates = cd_surrogates
+
+    return rotor
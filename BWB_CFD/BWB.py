@@ -2,6 +2,7 @@
 # 
 # Created:  Jan 2017, E. Botero
 # Modified: Mar 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -47,6 +48,15 @@ def main():
     mission = analyses.missions.base
     results = mission.evaluate()
 
+    # Uncomment to evaluate every mission in the container at once, one worker process per mission.
+    # Each mission runs in a folder named after its tag, so the analysis files do not collide.
+    # The module is shared with the tutorials one folder up.
+    #import os
+    #import sys
+    #sys.path.append(os.path.abspath(os.pardir))
+    #import Parallel_Missions
+    #all_results = Parallel_Missions.evaluate_missions(analyses.missions, separate_directories=True)
+
     # plt the old results
     plot_mission(results)
 
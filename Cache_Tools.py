@@ -0,0 +1,90 @@
+# Cache_Tools.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import hashlib
+from contextlib import contextmanager
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Hashing
+# ----------------------------------------------------------------------
+
+def update_hash(sha,value):
+    """Add a Data tree to a hash, in a form that is stable between processes."""
+
+    if isinstance(value,dict):
+        for key in sorted(value.keys()):
+            sha.update(str(key).encode())
+            update_hash(sha,value[key])
+    elif isinstance(value,(list,tuple)):
+        for item in value:
+            update_hash(sha,item)
+    elif isinstance(value,np.ndarray):
+        sha.update(str(value.dtype).encode())
+        sha.update(str(value.shape).encode())
+        sha.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value,(bool,int,float,complex,str,bytes,np.number,type(None))):
+        sha.update(repr(value).encode())
+    elif callable(value):
+        sha.update((getattr(value,'__module__','') + '.' + getattr(value,'__qualname__',type(value).__name__)).encode())
+    else:
+        sha.update(type(value).__name__.encode())
+
+    return
+
+def file_hash(filename):
+
+    with open(filename,'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+# ----------------------------------------------------------------------
+#   Files
+# ----------------------------------------------------------------------
+
+@contextmanager
+def atomic_write(filename):
+    """Open a temporary file for writing and rename it to filename once it is complete.
+
+    Readers in other processes see either the old file or the whole new one, never half a file.
+    """
+
+    temp = filename + '.' + str(os.getpid()) + '.tmp'
+    try:
+        with open(temp,'wb') as f:
+            yield f
+        os.replace(temp,filename)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+def save_pickle(filename,value):
+
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory,exist_ok=True)
+
+    with atomic_write(filename) as f:
+        pickle.dump(value,f)
+
+    return
+
+def load_pickle(filename):
+    """The pickled value in filename, or None if there is no complete file."""
+
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with open(filename,'rb') as f:
+            return pickle.load(f)
+    except (EOFError,pickle.UnpicklingError):
+        return None
@@ -0,0 +1,308 @@
+# Colored_Jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+
+# ----------------------------------------------------------------------
+#   Use Colored Jacobian
+# ----------------------------------------------------------------------
+
+def use_colored_jacobian(mission):
+    """Solve every segment of a mission with colored_newton instead of fsolve."""
+
+    for segment in mission.segments.values():
+        segment.settings.root_finder = colored_newton
+
+    return mission
+
+# ----------------------------------------------------------------------
+#   Colored Newton
+# ----------------------------------------------------------------------
+
+# the sparsity pattern and coloring of every layout of unknowns and residuals seen by this process
+_colorings = dict()
+
+# the last Jacobian of every solved system, keyed by the system and its layout
+_jacobians     = OrderedDict()
+_max_jacobians = 16
+
+def colored_newton(func,x0,args=(),xtol=1.49012e-08,maxfev=0,epsfcn=None,full_output=0,layout=None,max_updates=30):
+    """A quasi-Newton root finder called like scipy.optimize.fsolve, with a colored finite difference Jacobian.
+
+    The sparsity pattern comes from the layout of the unknowns and residuals: a residual of a
+    control point reads the unknowns of that point, and every residual of a group reads its
+    unknowns that are not per point, such as a segment time. For a segment the layout is read
+    from its unknowns and residuals, for other systems pass one built with segment_layout.
+    The columns are colored so that columns of the same color share no row, and a Jacobian
+    costs one residual evaluation per color instead of one per unknown.
+
+    The coupling the pattern leaves out, through the integration of the segment and its
+    final conditions, is picked up by Broyden updates of the factored Jacobian between
+    iterations, as fsolve does. The Jacobian is only evaluated again when a step makes no
+    progress, and it is kept for the next solve of the same system. A layout whose pattern
+    fails is solved with every group dense from then on.
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    x       = np.array(x0,dtype=float).ravel()
+    n       = len(x)
+    maxfev  = maxfev if maxfev > 0 else 200*(n + 1)
+    epsfcn  = epsfcn if epsfcn is not None else np.finfo(float).eps
+    step    = np.sqrt(max(epsfcn,np.finfo(float).eps))
+
+    nfev = [0]
+    def residuals(x):
+        nfev[0] += 1
+        return np.asarray(func(x,*args),dtype=float).ravel()
+
+    r = residuals(x)
+
+    if layout is None:
+        layout = segment_layout(args[0]) if args else None
+    if layout is None or len(layout[0]) != n or len(layout[2]) != len(r):
+        layout = dense_layout(n,len(r))
+
+    key    = layout_key(layout)
+    system = (id(args[0]) if args else None,key)
+
+    jacobian = _jacobians.pop(system,None)
+    scale    = jacobian.scale if jacobian is not None else np.zeros(n)
+    ier      = 5
+    fresh    = False
+    njev     = 0
+
+    while nfev[0] < maxfev:
+
+        if jacobian is None:
+            if key not in _colorings:
+                _colorings[key] = coloring(*layout)
+            J = colored_jacobian(residuals,x,r,step,*_colorings[key])
+            njev += 1
+            try:
+                jacobian = Quasi_Newton_Jacobian(J)
+            except RuntimeError:
+                jacobian = None
+            fresh = True
+
+            # the unknowns are scaled by the norms of their columns, as fsolve does
+            scale = np.maximum(scale,np.sqrt(np.asarray(J.multiply(J).sum(axis=0)).ravel()))
+            scale = np.where(scale > 0.,scale,1.)
+
+        dx = -jacobian.solve(r) if jacobian is not None else np.full(n,np.nan)
+
+        # backtrack until the residuals drop
+        norm    = np.linalg.norm(r)
+        alpha   = 1.
+        success = False
+        while np.all(np.isfinite(dx)) and alpha > 1e-3 and nfev[0] < maxfev:
+            x_new = x + alpha*dx
+            r_new = residuals(x_new)
+            if np.linalg.norm(r_new) < norm or norm == 0.:
+                success = True
+                break
+            alpha *= 0.5
+
+        if not success:
+            # at the root the residuals are noise and no step can lower them
+            if np.all(np.isfinite(dx)) and np.linalg.norm(scale*dx) <= xtol*max(np.linalg.norm(scale*x),xtol):
+                ier = 1
+                break
+            jacobian = None
+            if not fresh:
+                continue
+            if is_dense(layout):
+                break
+            # the pattern misses a strong coupling, fall back to dense groups for this layout
+            layout          = dense_groups(layout)
+            _colorings[key] = coloring(*layout)
+            fresh = False
+            continue
+
+        # only a full step measures the distance to the root
+        converged = alpha == 1. and np.linalg.norm(scale*dx) <= xtol*max(np.linalg.norm(scale*x),xtol)
+
+        if len(jacobian.updates) < max_updates:
+            jacobian.update(x_new - x,r_new - r)
+        else:
+            jacobian = None
+
+        x, r  = x_new, r_new
+        fresh = False
+
+        if converged or np.linalg.norm(r) == 0.:
+            ier = 1
+            break
+    else:
+        ier = 2
+
+    if jacobian is not None:
+        jacobian.scale     = scale
+        _jacobians[system] = jacobian
+        while len(_jacobians) > _max_jacobians:
+            _jacobians.popitem(last=False)
+
+    if not full_output:
+        return x
+
+    messages = {1:'The solution converged.',
+                2:'The number of calls to function has reached maxfev = %d.' % maxfev,
+                5:'The iteration is not making good progress.'}
+    infodict = dict(nfev=nfev[0],njev=njev,fvec=r)
+
+    return x, infodict, ier, messages[ier]
+
+# ----------------------------------------------------------------------
+#   Quasi-Newton Jacobian
+# ----------------------------------------------------------------------
+
+class Quasi_Newton_Jacobian(object):
+    """A sparse LU factored Jacobian with Broyden's rank one updates kept as an inverse product."""
+
+    def __init__(self,J):
+        self.factor  = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(J))
+        self.updates = []
+
+    def solve(self,r):
+        """The product of the inverse Jacobian and r."""
+
+        dx = self.factor.solve(r)
+        for u, v in self.updates:
+            dx += u*np.dot(v,r)
+
+        return dx
+
+    def solve_transpose(self,s):
+
+        dx = self.factor.solve(s,trans='T')
+        for u, v in self.updates:
+            dx += v*np.dot(u,s)
+
+        return dx
+
+    def update(self,s,y):
+        """Broyden's good update, so the Jacobian maps the step s onto the change of residuals y."""
+
+        Hy    = self.solve(y)
+        denom = np.dot(s,Hy)
+        if not np.isfinite(denom) or abs(denom) <= 1e-12*np.linalg.norm(s)*np.linalg.norm(Hy):
+            return
+
+        self.updates.append(((s - Hy)/denom,self.solve_transpose(s)))
+
+        return
+
+# ----------------------------------------------------------------------
+#   Layouts
+# ----------------------------------------------------------------------
+
+def segment_layout(segment,group=0):
+    """The group and control point of every packed unknown and residual of a segment.
+
+    Entries that are not per control point get the point -1. Returns the groups and points
+    of the unknowns, then those of the residuals, or None if the segment has no state.
+    """
+
+    try:
+        state    = segment.state
+        points   = state.numerics.number_control_points
+        unknowns = packed_points(state.unknowns,points)
+        errors   = packed_points(state.residuals,points)
+    except AttributeError:
+        return None
+
+    return (np.full(len(unknowns),group),unknowns,np.full(len(errors),group),errors)
+
+def packed_points(data,number_of_points):
+    """The control point of every entry of data.pack_array(), which unravels each array by columns."""
+
+    points = []
+    for value in data.values():
+        if isinstance(value,dict):
+            points.append(packed_points(value,number_of_points))
+            continue
+        if not isinstance(value,(int,float,np.ndarray)) or np.ndim(value) > 2:
+            continue
+
+        value = np.asarray(value)
+        rows  = value.shape[0] if value.ndim > 0 else 1
+        cols  = value.shape[1] if value.ndim > 1 else 1
+        if rows == number_of_points:
+            points.append(np.tile(np.arange(rows),cols))
+        else:
+            points.append(np.full(rows*cols,-1))
+
+    return np.concatenate(points).astype(int) if points else np.zeros(0,dtype=int)
+
+def dense_layout(number_of_unknowns,number_of_residuals):
+
+    return (np.zeros(number_of_unknowns,dtype=int),np.full(number_of_unknowns,-1),
+            np.zeros(number_of_residuals,dtype=int),np.full(number_of_residuals,-1))
+
+def dense_groups(layout):
+
+    return (layout[0],np.full(len(layout[1]),-1),layout[2],np.full(len(layout[3]),-1))
+
+def is_dense(layout):
+
+    return np.all(layout[1] < 0) and np.all(layout[3] < 0)
+
+def layout_key(layout):
+
+    return tuple(np.asarray(part,dtype=int).tobytes() for part in layout)
+
+# ----------------------------------------------------------------------
+#   Jacobians
+# ----------------------------------------------------------------------
+
+def coloring(column_groups,column_points,row_groups,row_points):
+    """The sparsity pattern of a layout and a coloring of its columns.
+
+    Columns of different groups or of different control points share no row, so the columns
+    of a control point are colored by their rank within it. The columns that are not per
+    point read every row of their group and each gets a color of its own.
+    """
+
+    same_group = row_groups[:,None] == column_groups[None,:]
+    same_point = row_points[:,None] == column_points[None,:]
+    pattern    = same_group & (same_point | (column_points[None,:] < 0))
+
+    colors = np.zeros(len(column_groups),dtype=int)
+    for group in np.unique(column_groups):
+        columns   = np.nonzero(column_groups == group)[0]
+        per_point = columns[column_points[columns] >= 0]
+        width     = 0
+        for point in np.unique(column_points[per_point]):
+            same            = per_point[column_points[per_point] == point]
+            colors[same]    = np.arange(len(same))
+            width           = max(width,len(same))
+        others         = columns[column_points[columns] < 0]
+        colors[others] = width + np.arange(len(others))
+
+    return pattern, colors
+
+def colored_jacobian(residuals,x,r,step,pattern,colors):
+
+    rows, cols = np.nonzero(pattern)
+    values     = np.zeros(len(rows))
+    h          = step*np.maximum(np.abs(x),1.)
+
+    for color in range(np.max(colors) + 1):
+        columns  = colors == color
+        x_step   = x + np.where(columns,h,0.)
+        change   = residuals(x_step) - r
+        in_color = columns[cols]
+        values[in_color] = change[rows[in_color]]/h[cols[in_color]]
+
+    return scipy.sparse.csc_matrix((values,(rows,cols)),shape=pattern.shape)
@@ -0,0 +1,161 @@
+# Mission_Profiler.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import json
+import time
+
+import scipy.optimize
+
+# ----------------------------------------------------------------------
+#   Profile Mission
+# ----------------------------------------------------------------------
+
+def profile_mission(mission,filename='mission_profile'):
+    """Evaluate a mission with every segment instrumented.
+
+    Writes a JSON report to filename.json and a folded stack trace, which flamegraph.pl and
+    speedscope read, to filename.folded. Returns the mission results.
+    """
+
+    profiler = Mission_Profiler()
+    profiler.instrument(mission)
+
+    results = mission.evaluate()
+
+    profiler.write_report(filename + '.json',results)
+    profiler.write_trace(filename + '.folded')
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Mission Profiler
+# ----------------------------------------------------------------------
+
+class Mission_Profiler(object):
+    """Time every step of every segment process of a mission.
+
+    Each function in the segment processes is wrapped, so the profiler records the calls and
+    the time of every process path (e.g. iterate.conditions.aerodynamics) of every segment.
+    The processes themselves are left in place, as the solvers call them directly. The
+    number of residual evaluations is the number of times the iterate steps ran. The root
+    finder of every segment is wrapped too, to record the function evaluations of each solve,
+    and the Jacobian evaluations where the root finder reports them (fsolve only does with an
+    analytic Jacobian). Choose the root finder before instrumenting the mission.
+    """
+
+    def __init__(self):
+        self.stack   = []
+        self.records = dict()
+        self.solves  = dict()
+
+    def instrument(self,mission):
+
+        for tag,segment in mission.segments.items():
+            self._wrap_process(segment.process,[mission.tag,tag])
+
+            # converge_root falls back on fsolve when a segment has no root finder
+            settings = segment.settings
+            settings.root_finder = self._counted(settings.get('root_finder',scipy.optimize.fsolve),tag)
+
+        return
+
+    def report(self,results=None):
+
+        report = dict()
+        for stack,record in self.records.items():
+            segment = report.setdefault(stack[1],dict(wall_time=0.,residual_evaluations=0,steps=dict()))
+            path    = '.'.join(stack[2:])
+            segment['steps'][path] = dict(calls=record[0],time=record[1])
+
+            # the exclusive times add up to the time spent in the segment
+            segment['wall_time'] += record[1] - record[2]
+            if stack[2] == 'iterate':
+                segment['residual_evaluations'] = max(segment['residual_evaluations'],record[0])
+
+        # the iterations of the root finder, one entry per solve
+        for tag,solves in self.solves.items():
+            if tag in report:
+                report[tag]['solves'] = solves
+
+        if results is not None:
+            for tag,segment in results.segments.items():
+                if tag in report:
+                    report[tag]['converged'] = bool(segment.numerics.get('converged',True))
+
+        return report
+
+    def write_report(self,filename,results=None):
+
+        with open(filename,'w') as f:
+            json.dump(self.report(results),f,indent=2)
+
+        return
+
+    def write_trace(self,filename):
+        """Write the exclusive time of each stack in microseconds, one folded stack per line."""
+
+        with open(filename,'w') as f:
+            for stack,record in self.records.items():
+                self_time = record[1] - record[2]
+                f.write(';'.join(stack) + ' ' + str(int(round(self_time*1e6))) + '\n')
+
+        return
+
+    def _wrap_process(self,process,stack):
+
+        for key in list(process.keys()):
+            step = process[key]
+            if hasattr(step,'evaluate'):
+                self._wrap_process(step,stack + [key])
+            elif callable(step):
+                process[key] = self._timed(step,stack + [key])
+
+        return
+
+    def _counted(self,root_finder,tag):
+
+        profiler = self
+
+        def counted(*args,**kwargs):
+            outputs = root_finder(*args,**kwargs)
+
+            # converge_root asks for the full output, which carries the evaluation counts
+            if kwargs.get('full_output',False):
+                infodict, ier = outputs[1], outputs[2]
+                solve = dict(function_evaluations=int(infodict['nfev']),ier=int(ier))
+                if 'njev' in infodict:
+                    solve['jacobian_evaluations'] = int(infodict['njev'])
+                profiler.solves.setdefault(tag,[]).append(solve)
+
+            return outputs
+
+        return counted
+
+    def _timed(self,function,stack):
+
+        stack    = tuple(stack)
+        profiler = self
+
+        # a closure rather than an object, as deep copies of a segment share functions
+        def timed(*args,**kwargs):
+            profiler.stack.append(0.)
+            t0 = time.perf_counter()
+            try:
+                return function(*args,**kwargs)
+            finally:
+                elapsed  = time.perf_counter() - t0
+                children = profiler.stack.pop()
+                if profiler.stack:
+                    profiler.stack[-1] += elapsed
+                record     = profiler.records.setdefault(stack,[0,0.,0.])
+                record[0] += 1
+                record[1] += elapsed
+                record[2] += children
+
+        return timed
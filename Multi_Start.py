@@ -0,0 +1,99 @@
+# Multi_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from SUAVE.Core import Data
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+
+# ----------------------------------------------------------------------
+#   Multi-Start Solve
+# ----------------------------------------------------------------------
+
+def multi_start_solve(problem,number_of_starts,number_of_workers=None,seed=None,tolerance=1e-6,**solver_args):
+    """Solve the problem from several starting points, sampled by Latin hypercube inside the input bounds.
+
+    Each start is an independent scipy_setup.SciPy_Solve run in a process pool, where every worker
+    holds its own copy of the nexus. Returns a list of results ranked with the feasible starts
+    first, then by objective. Each result holds the initial point, the scaled optimum, the
+    objective, the constraints and the time the start took.
+    """
+
+    inputs   = problem.optimization_problem.inputs
+    lower    = inputs[:,2].astype(float)
+    upper    = inputs[:,3].astype(float)
+    initials = lower + latin_hypercube(number_of_starts,len(inputs),seed)*(upper-lower)
+
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=number_of_workers,initializer=initialize_worker,initargs=(problem,)) as pool:
+        futures = [pool.submit(solve_start,ii,initial,tolerance,solver_args) for ii,initial in enumerate(initials)]
+        results = [future.result() for future in futures]
+
+    results.sort(key=lambda result: (not result.feasible, result.objective))
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Workers
+# ----------------------------------------------------------------------
+
+_worker_problem = None
+
+def initialize_worker(problem):
+
+    global _worker_problem
+    _worker_problem = deepcopy(problem)
+
+    return
+
+def solve_start(index,initial,tolerance,solver_args):
+
+    problem = _worker_problem
+    problem.optimization_problem.inputs[:,1] = initial
+
+    t0     = time.time()
+    output = scipy_setup.SciPy_Solve(problem,**solver_args)
+    x      = np.asarray(output,dtype=float)
+
+    result             = Data()
+    result.start       = index
+    result.initial     = initial
+    result.x           = x
+    result.objective   = float(np.atleast_1d(problem.objective(x))[0])
+    result.constraints = np.atleast_1d(problem.all_constraints(x)).astype(float)
+    result.time        = time.time() - t0
+
+    # scipy's sign convention, inequalities are satisfied when positive
+    inequality      = np.atleast_1d(problem.inequality_constraint(x)).astype(float)
+    equality        = np.atleast_1d(problem.equality_constraint(x)).astype(float)
+    result.feasible = bool(np.all(inequality >= -tolerance) and np.all(np.abs(equality) <= tolerance))
+
+    return result
+
+# ----------------------------------------------------------------------
+#   Latin Hypercube Sampling
+# ----------------------------------------------------------------------
+
+def latin_hypercube(number_of_samples,number_of_dimensions,seed=None):
+    """Samples in the unit hypercube with exactly one sample in each of the equal strata of every dimension."""
+
+    rng     = np.random.RandomState(seed)
+    samples = np.zeros((number_of_samples,number_of_dimensions))
+    for jj in range(number_of_dimensions):
+        strata        = rng.permutation(number_of_samples)
+        samples[:,jj] = (strata + rng.uniform(size=number_of_samples))/number_of_samples
+
+    return samples
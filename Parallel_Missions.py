@@ -0,0 +1,71 @@
+# Parallel_Missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#   Evaluate Missions
+# ----------------------------------------------------------------------
+
+def evaluate_missions(missions,number_of_workers=None,separate_directories=False):
+    """Evaluate every mission of a Mission.Container in its own worker process.
+
+    The missions are independent, so the container finishes in the time of the slowest one.
+    Returns the results under the same tags as the container. Analyses that write files
+    with fixed names, like AVL and SU2, should set separate_directories so every mission
+    runs in a folder named after its tag.
+    """
+
+    tags = list(missions.keys())
+    if number_of_workers is None:
+        number_of_workers = min(len(tags),os.cpu_count())
+
+    with ProcessPoolExecutor(max_workers=number_of_workers,initializer=initialize_worker,
+                             initargs=(missions,separate_directories)) as pool:
+        futures = [pool.submit(evaluate_mission,tag) for tag in tags]
+
+        results = Data()
+        for tag,future in zip(tags,futures):
+            results[tag] = future.result()
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Workers
+# ----------------------------------------------------------------------
+
+_worker_missions    = None
+_worker_directories = False
+
+def initialize_worker(missions,separate_directories):
+
+    global _worker_missions, _worker_directories
+    _worker_missions    = missions
+    _worker_directories = separate_directories
+
+    return
+
+def evaluate_mission(tag):
+
+    mission = _worker_missions[tag]
+
+    if not _worker_directories:
+        return mission.evaluate()
+
+    # the directory is left in place, so the files of each mission can be inspected
+    cwd = os.getcwd()
+    os.makedirs(tag,exist_ok=True)
+    os.chdir(tag)
+    try:
+        return mission.evaluate()
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,236 @@
+# Payload_Range.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from SUAVE.Core import Data, Units
+
+# ----------------------------------------------------------------------
+#   Payload Range
+# ----------------------------------------------------------------------
+
+def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.,number_of_intermediate=0,
+                  number_of_workers=None,initial_distances=None,tolerance=1.,max_iterations=10,method='specific_range'):
+    """Solve the payload range diagram with the points split over worker processes.
+
+    The cruise distance of every point is iterated until the mission burns the fuel of the
+    point less the reserves. The corner points are the range with max payload, with max fuel
+    and the ferry range, and number_of_intermediate payloads are added between each pair of
+    corners.
+
+    Each worker solves a run of neighbouring points and starts every point from the cruise
+    distance of the one before. For a family of variants, pass the cruise_distance of the
+    previous variant's results as initial_distances to start every point from it. A point is
+    converged when the fuel burned is within tolerance, in kg, of its target.
+
+    method is 'specific_range', the update SUAVE uses, or 'newton', see solve_point.
+
+    The results start with the zero range point, which carries the max payload, no fuel and
+    a takeoff weight of the operating empty weight plus the max payload. The range is in
+    nautical miles, the masses in kg and the cruise distances in m. These are not the same
+    arrays as SUAVE.Methods.Performance.payload_range returns, which has no intermediate
+    points and reports other takeoff weights and fuels at some points.
+    """
+
+    points = diagram_points(vehicle,reserves,number_of_intermediate)
+    if points is None:
+        return True
+
+    takeoff_weights, fuels, payloads = points
+    number_of_points = len(fuels)
+
+    if initial_distances is None:
+        guesses = [None] * number_of_points
+    else:
+        guesses = list(initial_distances[1:])
+
+    if number_of_workers is None:
+        number_of_workers = min(number_of_points,os.cpu_count())
+
+    # neighbouring points burn similar fuel, so each worker gets a run of them
+    runs = np.array_split(np.arange(number_of_points),number_of_workers)
+    runs = [run for run in runs if len(run)]
+
+    with ProcessPoolExecutor(max_workers=len(runs),initializer=initialize_worker,
+                             initargs=(mission,cruise_segment_tag,reserves,tolerance,max_iterations,method)) as pool:
+        futures = [pool.submit(solve_run,[takeoff_weights[i] for i in run],[fuels[i] for i in run],
+                               [guesses[i] for i in run]) for run in runs]
+
+        solved = []
+        for future in futures:
+            solved.extend(future.result())
+
+    ranges     = [point[0] for point in solved]
+    distances  = [point[1] for point in solved]
+    iterations = [point[2] for point in solved]
+
+    # start at zero range with max payload and no fuel
+    operating_empty = vehicle.mass_properties.operating_empty
+    results = Data()
+    results.range           = np.array([0.] + ranges) / Units.nautical_mile
+    results.payload         = [payloads[0]] + payloads
+    results.fuel            = [0.] + fuels
+    results.takeoff_weight  = [operating_empty + payloads[0]] + takeoff_weights
+    results.reserves        = reserves
+    results.cruise_distance = [0.] + distances
+    results.iterations      = iterations
+
+    return results
+
+def diagram_points(vehicle,reserves,number_of_intermediate=0):
+    """The takeoff weight, fuel and payload of every point, ordered from max payload to ferry."""
+
+    masses = vehicle.mass_properties
+
+    if not masses.operating_empty:
+        print("Error calculating Payload Range Diagram: Vehicle Operating Empty not defined")
+        return None
+    if not masses.max_zero_fuel:
+        print("Error calculating Payload Range Diagram: Vehicle MZFW not defined")
+        return None
+    if not masses.max_takeoff:
+        print("Error calculating Payload Range Diagram: Vehicle MTOW not defined")
+        return None
+
+    OEW  = masses.operating_empty
+    MZFW = masses.max_zero_fuel
+    MTOW = masses.max_takeoff
+
+    if not masses.get('max_payload',0.):
+        max_payload = MZFW - OEW
+    else:
+        max_payload = min(masses.max_payload,MZFW - OEW)
+
+    if not masses.get('max_fuel',0.):
+        max_fuel = MTOW - OEW
+    else:
+        max_fuel = min(masses.max_fuel,MTOW - OEW)
+
+    # max payload, max fuel and ferry
+    corner_takeoff_weights = [MTOW, MTOW, OEW + max_fuel]
+    corner_fuels           = [min(MTOW - OEW - max_payload,max_fuel), max_fuel, max_fuel]
+    corner_payloads        = [max_payload, MTOW - max_fuel - OEW, 0.]
+
+    takeoff_weights = [corner_takeoff_weights[0]]
+    fuels           = [corner_fuels[0]]
+    payloads        = [corner_payloads[0]]
+
+    # payload is traded linearly for fuel, then for takeoff weight, between the corners
+    for i in range(2):
+        for fraction in np.linspace(0.,1.,number_of_intermediate + 2)[1:]:
+            takeoff_weights.append(corner_takeoff_weights[i] + fraction*(corner_takeoff_weights[i+1] - corner_takeoff_weights[i]))
+            fuels.append(corner_fuels[i] + fraction*(corner_fuels[i+1] - corner_fuels[i]))
+            payloads.append(corner_payloads[i] + fraction*(corner_payloads[i+1] - corner_payloads[i]))
+
+    return takeoff_weights, fuels, payloads
+
+# ----------------------------------------------------------------------
+#   Workers
+# ----------------------------------------------------------------------
+
+_worker = None
+
+def initialize_worker(mission,cruise_segment_tag,reserves,tolerance,max_iterations,method):
+
+    global _worker
+    _worker = Data()
+    _worker.mission            = mission
+    _worker.cruise_segment_tag = cruise_segment_tag
+    _worker.reserves           = reserves
+    _worker.tolerance          = tolerance
+    _worker.max_iterations     = max_iterations
+    _worker.method             = method
+
+    return
+
+def solve_run(takeoff_weights,fuels,guesses):
+
+    solved   = []
+    previous = None
+
+    for takeoff_weight, fuel, guess in zip(takeoff_weights,fuels,guesses):
+
+        # the previous point is the closest warm start unless a guess is given
+        if guess is None and previous is not None:
+            guess = previous
+
+        solution = solve_point(_worker.mission,_worker.cruise_segment_tag,takeoff_weight,fuel,
+                               _worker.reserves,guess,_worker.tolerance,_worker.max_iterations,
+                               _worker.method)
+        solved.append(solution)
+        previous = solution[1]
+
+    return solved
+
+# ----------------------------------------------------------------------
+#   Solve Point
+# ----------------------------------------------------------------------
+
+def solve_point(mission,cruise_segment_tag,takeoff_weight,fuel,reserves,distance=None,tolerance=1.,max_iterations=10,
+                method='specific_range'):
+    """Iterate the cruise distance until the mission burns fuel less the reserves.
+
+    The 'specific_range' method flies the missing fuel at the average specific range of the
+    cruise. The 'newton' method uses the derivative of the fuel burned with respect to the
+    cruise distance: the first step takes the Breguet estimate, the fuel flow over the ground
+    speed at the end of the cruise, and later steps the secant of the last two evaluations.
+    It usually converges in two or three mission evaluations.
+
+    Returns the range, the cruise distance and the number of mission evaluations.
+    """
+
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = takeoff_weight
+    if distance is not None:
+        mission.segments[cruise_segment_tag].distance = distance
+
+    results     = mission.evaluate()
+    evaluations = 1
+    error       = fuel_error(results,takeoff_weight,fuel,reserves)
+    previous    = None
+
+    while abs(error) > tolerance and evaluations <= max_iterations:
+
+        segment     = results.segments[cruise_segment_tag]
+        cruise_dist = np.diff(segment.conditions.frames.inertial.position_vector[[0,-1],0])[0]
+        cruise_fuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]
+
+        # fly the missing fuel at the specific range of the cruise
+        slope = cruise_fuel / cruise_dist
+
+        if method == 'newton':
+            if previous is None:
+                # the extra distance is flown at the end of the cruise
+                mass_rate = segment.conditions.weights.vehicle_mass_rate[-1,0]
+                speed     = segment.conditions.frames.inertial.velocity_vector[-1,0]
+                newton    = mass_rate / speed
+            else:
+                newton    = (error - previous[1]) / (cruise_dist - previous[0])
+            if np.isfinite(newton) and newton > 0.:
+                slope = newton
+
+        previous = (cruise_dist, error)
+        mission.segments[cruise_segment_tag].distance = cruise_dist - error / slope
+
+        results      = mission.evaluate()
+        evaluations += 1
+        error        = fuel_error(results,takeoff_weight,fuel,reserves)
+
+    distance      = mission.segments[cruise_segment_tag].distance
+    mission_range = results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+
+    return mission_range, distance, evaluations
+
+def fuel_error(results,takeoff_weight,fuel,reserves):
+
+    burned = takeoff_weight - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    return burned - fuel + reserves
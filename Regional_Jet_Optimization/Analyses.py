@@ -2,6 +2,7 @@
 # 
 # Created:  Mar 2016, M. Vegh
 # Modified: Aug 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -12,13 +13,17 @@ from SUAVE.Core import Units
 
 import numpy as np
 
+import Surrogates
+import Atmosphere_Table
+
 # ----------------------------------------------------------------------        
 #   Setup Analyses
 # ----------------------------------------------------------------------  
 
 def setup(configs):
     
-    analyses = SUAVE.Analyses.Analysis.Container()
+    # finalizing this container reuses trained aerodynamic surrogates
+    analyses = Surrogates.Container()
 
     # build a base analysis for each config
     for tag,config in configs.items():
@@ -83,7 +88,7 @@ def base(vehicle):
 
     # ------------------------------------------------------------------
     #  Atmosphere Analysis
-    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere = Atmosphere_Table.US_Standard_1976_Table()
     atmosphere.features.planet = planet.features
     analyses.append(atmosphere)   
 
@@ -0,0 +1,96 @@
+# Atmosphere_Table.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+import SUAVE
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+# ----------------------------------------------------------------------
+#   Atmosphere Table
+# ----------------------------------------------------------------------
+
+# tables shared by every atmosphere of this process, keyed by grid
+_tables = dict()
+
+# Sutherland's constant of air, in K
+SUTHERLAND = 110.4
+
+class US_Standard_1976_Table(SUAVE.Analyses.Atmospheric.US_Standard_1976):
+    """US_Standard_1976, interpolated from a table tabulated once per process.
+
+    The standard day is tabulated every altitude_step from minimum_altitude to
+    maximum_altitude, with the pressure and density interpolated in log. A temperature
+    deviation keeps the pressure and shifts the temperature, and the density, speed of sound
+    and viscosity follow from it, as in US_Standard_1976. One call returns all five
+    quantities. Altitudes off the table fall back to US_Standard_1976.
+    """
+
+    def __defaults__(self):
+        self.minimum_altitude = -1000.
+        self.maximum_altitude = 80000.
+        self.altitude_step    = 5.
+
+    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
+
+        zs = np.array(altitude,dtype=float)
+        zs = zs.reshape(-1,1) if zs.ndim < 2 else zs
+
+        if var_gamma or np.min(zs) < self.minimum_altitude or np.max(zs) > self.maximum_altitude:
+            return SUAVE.Analyses.Atmospheric.US_Standard_1976.compute_values(self,altitude,temperature_deviation,var_gamma)
+
+        table = self.table()
+
+        position = (zs - self.minimum_altitude) / self.altitude_step
+        index    = np.minimum(position.astype(int),table.shape[1] - 2)
+        fraction = position - index
+
+        values = (1. - fraction)*table[:,index] + fraction*table[:,index + 1]
+        p   = np.exp(values[0])
+        T0  = values[1]
+        rho = np.exp(values[2])
+        a   = values[3]
+        mu  = values[4]
+
+        if np.any(temperature_deviation != 0.):
+            T   = T0 + temperature_deviation
+            rho = rho*T0/T
+            a   = a*np.sqrt(T/T0)
+            mu  = mu*(T/T0)**1.5*(T0 + SUTHERLAND)/(T + SUTHERLAND)
+        else:
+            T   = T0
+
+        atmo_data = Conditions()
+        atmo_data.expand_rows(zs.shape[0])
+        atmo_data.pressure          = p
+        atmo_data.temperature       = T
+        atmo_data.density           = rho
+        atmo_data.speed_of_sound    = a
+        atmo_data.dynamic_viscosity = mu
+
+        return atmo_data
+
+    def table(self):
+        """The standard day on the grid, as rows of log pressure, temperature, log density,
+        speed of sound and viscosity."""
+
+        key = (type(self).__name__,self.minimum_altitude,self.maximum_altitude,self.altitude_step)
+
+        if key not in _tables:
+            number = int(round((self.maximum_altitude - self.minimum_altitude)/self.altitude_step)) + 1
+            zs     = np.linspace(self.minimum_altitude,self.maximum_altitude,number)[:,None]
+            data   = SUAVE.Analyses.Atmospheric.US_Standard_1976.compute_values(self,zs)
+
+            _tables[key] = np.array([np.log(data.pressure[:,0]),
+                                     data.temperature[:,0],
+                                     np.log(data.density[:,0]),
+                                     data.speed_of_sound[:,0],
+                                     data.dynamic_viscosity[:,0]])
+
+        return _tables[key]
@@ -0,0 +1,195 @@
+# Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+from copy import deepcopy
+from collections import OrderedDict
+
+import numpy as np
+
+from SUAVE.Optimization import Nexus
+
+from Cache_Tools import save_pickle, load_pickle
+
+# ----------------------------------------------------------------------
+#   Evaluation Cache
+# ----------------------------------------------------------------------
+
+class Evaluation_Cache(object):
+    """A bounded LRU cache backed by a directory of pickle files.
+
+    Entries are keyed by a hash of the salt, the problem definition (inputs with their
+    bounds and scalings, objective, constraints and aliases) and the scaled input vector,
+    so a cache directory can be shared between runs of the same problem. The salt should
+    change whenever a module the procedure runs changes. The directory keeps at most
+    max_disk_size entries, dropping the least recently used ones.
+    """
+
+    def __init__(self,directory='nexus_cache',max_size=256,salt='',max_disk_size=4096):
+        self.directory     = directory
+        self.max_size      = max_size
+        self.max_disk_size = max_disk_size
+        self.salt          = salt
+        self.memory    = OrderedDict()
+        self.hits      = 0
+        self.misses    = 0
+
+        if self.directory is not None and not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def key(self,problem,x):
+
+        sha = hashlib.sha1(self.salt.encode())
+        sha.update(problem_hash(problem).encode())
+        sha.update(np.asarray(x,dtype=float).tobytes())
+
+        return sha.hexdigest()
+
+    def get(self,key):
+
+        # memory first
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return deepcopy(self.memory[key])
+
+        # then the disk
+        filename = self._filename(key)
+        if filename is not None:
+            value = load_pickle(filename)
+            if value is not None:
+                # mark the file as recently used
+                os.utime(filename)
+                self._remember(key,value)
+                self.hits += 1
+                return deepcopy(value)
+
+        self.misses += 1
+
+        return None
+
+    def store(self,key,value):
+
+        value = deepcopy(value)
+        self._remember(key,value)
+
+        filename = self._filename(key)
+        if filename is not None:
+            save_pickle(filename,value)
+            self._trim_directory()
+
+        return
+
+    def _trim_directory(self):
+
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pkl')]
+        if len(entries) <= self.max_disk_size:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_disk_size]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+        return
+
+    def _remember(self,key,value):
+
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+        return
+
+    def _filename(self,key):
+
+        if self.directory is None:
+            return None
+
+        return os.path.join(self.directory,key + '.pkl')
+
+# ----------------------------------------------------------------------
+#   Problem Hash
+# ----------------------------------------------------------------------
+
+def problem_hash(problem):
+    """Hash the definition of an optimization problem, without the current values of its inputs.
+
+    The inputs are hashed by tag, bounds, scaling and units, as x is scaled and a new scaling
+    or alias moves every point. Their current values are left out, since unpack_inputs
+    overwrites them with the last evaluated point.
+    """
+
+    inputs     = np.asarray(problem.inputs,dtype=object)
+    definition = [inputs[:,[0,2,3,4,5]],problem.objective,problem.constraints]
+
+    sha = hashlib.sha1()
+    for table in definition:
+        for row in table:
+            sha.update(','.join([str(item) for item in row]).encode())
+    sha.update(str(problem.aliases).encode())
+
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Source Fingerprint
+# ----------------------------------------------------------------------
+
+def source_fingerprint(modules):
+    """Hash the source files of the given modules, to be used as a cache salt."""
+
+    sha = hashlib.sha1()
+    for module in modules:
+        with open(module.__file__,'rb') as f:
+            sha.update(f.read())
+
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Cached Nexus
+# ----------------------------------------------------------------------
+
+class Cached_Nexus(Nexus):
+    """A Nexus that returns the stored summary for input vectors it has already evaluated.
+
+    Only the summary is restored on a cache hit. The results of the last full evaluation
+    are left in place, so call evaluate_uncached before plotting the mission.
+    """
+
+    def __defaults__(self):
+        self.evaluation_cache = None
+
+    def evaluate(self,x = None):
+
+        cache = self.evaluation_cache
+
+        # without a vector there is nothing to key on, so run the procedure
+        if cache is None or x is None:
+            return Nexus.evaluate(self,x)
+
+        key     = cache.key(self.optimization_problem,x)
+        summary = cache.get(key)
+
+        if summary is not None:
+            self.unpack_inputs(x)
+            self.summary = summary
+            return
+
+        Nexus.evaluate(self,x)
+        cache.store(key,self.summary)
+
+        return
+
+    def evaluate_uncached(self,x = None):
+
+        return Nexus.evaluate(self,x)
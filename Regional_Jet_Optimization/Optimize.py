@@ -2,6 +2,7 @@
 # Created:  Feb 2016, M. Vegh
 # Modified: Aug 2017, E. Botero
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -10,14 +11,24 @@
 import SUAVE
 assert SUAVE.__version__=='2.5.2', 'These tutorials only work with the SUAVE 2.5.2 release'
 from SUAVE.Core import Units, Data
+import os
+import sys
 import numpy as np
+# the caching helpers, surrogates and multi-start driver are shared with the tutorials one folder up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir))
 import Vehicles
 import Analyses
 import Missions
 import Procedure
 import Plot_Mission
+import Atmosphere_Table
+import Tracked_Process
+import Weight_Cache
+import Surrogates
+import Warm_Start
+import Cache
+import Sweep
 import matplotlib.pyplot as plt
-from SUAVE.Optimization import Nexus, carpet_plot
 import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
 
 # ----------------------------------------------------------------------        
@@ -35,10 +46,23 @@ def main():
     
     # Uncomment for the first optimization
     output = scipy_setup.SciPy_Solve(problem,solver='SLSQP')
+    
+    # Uncomment instead to compute the finite difference gradients in a process pool
+    #import Parallel
+    #output = Parallel.SciPy_Solve(problem,number_of_workers=16)
+    
+    # Uncomment instead to solve from several Latin hypercube starting points in a process pool
+    #import Multi_Start
+    #results = Multi_Start.multi_start_solve(problem,8,solver='SLSQP')
+    #output  = results[0].x
     print (output)    
+    
+    # Cache hits and parallel workers leave the mission results behind, so rerun the optimum
+    problem.evaluate_uncached(output)
 
     print('fuel burn = ', problem.summary.base_mission_fuelburn)
     print('fuel margin = ', problem.all_constraints())
+    print('weight evaluations reused = ', Weight_Cache.hit_rate())
     
     Plot_Mission.plot_mission(problem)
     
@@ -50,7 +74,7 @@ def main():
 
 def setup():
 
-    nexus = Nexus()
+    nexus = Cache.Cached_Nexus()
     problem = Data()
     nexus.optimization_problem = problem
 
@@ -121,11 +145,23 @@ def setup():
     # -------------------------------------------------------------------    
     nexus.summary = Data()    
     nexus.total_number_of_iterations = 0
+    
+    # -------------------------------------------------------------------
+    #  Evaluation Cache
+    # -------------------------------------------------------------------
+    # Repeated input vectors return the stored summary instead of rerunning the procedure.
+    # The salt invalidates the stored entries whenever this file, one of the setup files or
+    # a module the procedure runs is edited.
+    modules = [sys.modules[__name__],Vehicles,Analyses,Missions,Procedure,Atmosphere_Table,
+               Tracked_Process,Weight_Cache,Surrogates,Warm_Start]
+    salt    = Cache.source_fingerprint(modules)
+    nexus.evaluation_cache = Cache.Evaluation_Cache('nexus_cache',max_size=256,salt=salt,max_disk_size=4096)
+    
     return nexus
     
-def variable_sweep(problem):    
-    number_of_points = 5
-    outputs     = carpet_plot(problem, number_of_points, 0, 0)  #run carpet plot, suppressing default plots
+def variable_sweep(problem,number_of_points=5,number_of_workers=None):    
+    # run the grid in a process pool, streaming the points to a file so a crashed sweep can resume
+    outputs     = Sweep.carpet_sweep(problem, number_of_points, 'sweep_results.txt', number_of_workers)
     inputs      = outputs.inputs
     objective   = outputs.objective
     constraints = outputs.constraint_val
@@ -0,0 +1,175 @@
+# Output_Writer.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import glob
+import time
+import atexit
+import queue
+import threading
+import multiprocessing.util
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Optimization import helper_functions as help_fun
+
+from Cache_Tools import atomic_write
+
+# ----------------------------------------------------------------------
+#   Output Writer
+# ----------------------------------------------------------------------
+
+class Output_Writer(object):
+    """Write the optimization iterations from a background thread, in batches of .npz chunks.
+
+    The record of an iteration is copied on the calling thread and put on a bounded queue.
+    The writer thread saves a chunk when a batch is full or the queue has been idle for a
+    second. Every process writes its own chunk files, so several workers can share a
+    directory, and the last batch is written when the process exits. Chunks are named by run,
+    so the records of earlier optimizations in the same directory are kept apart.
+    """
+
+    def __init__(self,directory='optimization_outputs',batch_size=64,max_queue_size=1024):
+        self.directory      = directory
+        self.batch_size     = batch_size
+        self.max_queue_size = max_queue_size
+        self.pid            = None
+
+        # the first writer of a run names it, worker processes inherit the name through the environment
+        self.run = os.environ.setdefault('SUAVE_OUTPUT_RUN',time.strftime('%Y%m%dT%H%M%S') + '-' + str(os.getpid()))
+
+    def write(self,nexus):
+
+        # a forked process needs its own queue and thread
+        if self.pid != os.getpid():
+            self._start()
+
+        problem = nexus.optimization_problem
+        aliases = problem.aliases
+
+        record             = Data()
+        record.iteration   = nexus.total_number_of_iterations
+        record.inputs      = np.array(problem.inputs[:,1],dtype=float)
+        record.objective   = np.array(help_fun.get_values(nexus,problem.objective,aliases),dtype=float)
+        record.constraints = np.array(help_fun.get_values(nexus,problem.constraints,aliases),dtype=float)
+
+        if self.tags is None:
+            self.tags = [problem.inputs[:,0],problem.objective[:,0],problem.constraints[:,0]]
+
+        self.queue.put(record)
+
+        return
+
+    def close(self):
+        """Write everything still in the queue and stop the thread."""
+
+        if self.pid != os.getpid():
+            return
+
+        self.queue.put(None)
+        self.thread.join()
+        self.pid = None
+
+        return
+
+    def _start(self):
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory,exist_ok=True)
+
+        self.pid    = os.getpid()
+        self.chunk  = 0
+        self.tags   = None
+        self.queue  = queue.Queue(maxsize=self.max_queue_size)
+        self.thread = threading.Thread(target=self._run,daemon=True)
+        self.thread.start()
+
+        # flush on exit, the finalizer also covers multiprocessing workers which skip atexit
+        atexit.register(self.close)
+        multiprocessing.util.Finalize(self,self.close,exitpriority=10)
+
+        return
+
+    def _run(self):
+
+        batch = []
+        while True:
+            try:
+                record = self.queue.get(timeout=1.0)
+            except queue.Empty:
+                record = False
+
+            finished = record is None
+            idle     = record is False
+            if not (finished or idle):
+                batch.append(record)
+
+            if batch and (finished or idle or len(batch) >= self.batch_size):
+                self._save(batch)
+                batch = []
+
+            if finished:
+                return
+
+    def _save(self,batch):
+
+        name     = 'chunk_%s_%d_%06d.npz' % (self.run,self.pid,self.chunk)
+        filename = os.path.join(self.directory,name)
+        self.chunk += 1
+
+        # only complete chunks ever carry the final name
+        with atomic_write(filename) as f:
+            np.savez(f,
+                     iteration       = np.array([record.iteration for record in batch]),
+                     inputs          = np.vstack([record.inputs for record in batch]),
+                     objective       = np.vstack([record.objective for record in batch]),
+                     constraints     = np.vstack([record.constraints for record in batch]),
+                     input_tags      = np.array(self.tags[0],dtype=str),
+                     objective_tags  = np.array(self.tags[1],dtype=str),
+                     constraint_tags = np.array(self.tags[2],dtype=str))
+
+        return
+
+# ----------------------------------------------------------------------
+#   Read Outputs
+# ----------------------------------------------------------------------
+
+def read_outputs(directory='optimization_outputs',run=None):
+    """Collect the chunks of every process of one run into one set of columns.
+
+    The run defaults to the latest one in the directory, list them with read_runs.
+    """
+
+    if run is None:
+        runs = read_runs(directory)
+        if not runs:
+            return Data()
+        run = runs[-1]
+
+    filenames = sorted(glob.glob(os.path.join(directory,'chunk_' + run + '_*.npz')))
+
+    outputs = Data()
+    if not filenames:
+        return outputs
+
+    chunks = [np.load(filename) for filename in filenames]
+    for key in ['iteration','inputs','objective','constraints']:
+        outputs[key] = np.concatenate([chunk[key] for chunk in chunks])
+    for key in ['input_tags','objective_tags','constraint_tags']:
+        outputs[key] = chunks[0][key]
+
+    return outputs
+
+def read_runs(directory='optimization_outputs'):
+    """The runs with chunks in the directory, oldest first."""
+
+    names = [os.path.basename(filename) for filename in glob.glob(os.path.join(directory,'chunk_*.npz'))]
+
+    return sorted(set([name.split('_')[1] for name in names]))
@@ -0,0 +1,166 @@
+# Parallel.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy as sp
+import scipy.optimize
+
+# ----------------------------------------------------------------------
+#   Worker State
+# ----------------------------------------------------------------------
+
+# each worker process keeps its own copy of the nexus
+_worker_nexus = None
+
+def initialize_worker(nexus):
+    """Give this worker its own deep copy of the vehicle configurations, analyses and missions."""
+
+    global _worker_nexus
+    _worker_nexus = deepcopy(nexus)
+
+    return
+
+def evaluate_point(x):
+    """Evaluate the objective and constraints of the worker nexus at a scaled input vector."""
+
+    nexus = _worker_nexus
+    x     = np.asarray(x,dtype=float)
+
+    obj  = np.atleast_1d(nexus.objective(x)).astype(float)
+    ineq = np.atleast_1d(nexus.inequality_constraint(x)).astype(float)
+    eq   = np.atleast_1d(nexus.equality_constraint(x)).astype(float)
+
+    return obj, ineq, eq
+
+def evaluate_sweep_point(x):
+    """Evaluate the objective and all of the constraints, in the form carpet plots use."""
+
+    nexus = _worker_nexus
+    x     = np.asarray(x,dtype=float)
+
+    obj = np.atleast_1d(nexus.objective(x)).astype(float)
+    con = np.atleast_1d(nexus.all_constraints(x)).astype(float)
+
+    return obj, con
+
+def make_pool(nexus,number_of_workers=None):
+    """Start a process pool whose workers each hold a copy of the nexus."""
+
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count()
+
+    return ProcessPoolExecutor(max_workers=number_of_workers,initializer=initialize_worker,initargs=(nexus,))
+
+# ----------------------------------------------------------------------
+#   Parallel Finite Differences
+# ----------------------------------------------------------------------
+
+class Parallel_Finite_Difference(object):
+    """Forward differences of the objective and constraints, with the N+1 points sent to a pool.
+
+    The values and gradients of the last point are kept, so the objective, the constraints
+    and their jacobians at the same point only cost one batch of evaluations.
+    """
+
+    def __init__(self,pool,diff_interval=1.4901161193847656e-08):
+        self.pool          = pool
+        self.diff_interval = diff_interval
+        self.last_x        = None
+        self.values        = None
+        self.gradients     = None
+
+    def update(self,x):
+
+        x = np.asarray(x,dtype=float)
+        if self.last_x is not None and np.array_equal(x,self.last_x):
+            return
+
+        # the base point and one perturbation per input
+        points = [x]
+        for ii in range(len(x)):
+            newx      = x*1.0
+            newx[ii] += self.diff_interval
+            points.append(newx)
+
+        evaluations = list(self.pool.map(evaluate_point,points))
+
+        base           = evaluations[0]
+        self.values    = base
+        self.gradients = []
+        for jj in range(len(base)):
+            perturbed = np.array([evaluation[jj] for evaluation in evaluations[1:]])
+            self.gradients.append(((perturbed - base[jj])/self.diff_interval).T)
+
+        self.last_x = x*1.0
+
+        return
+
+    def objective(self,x):
+        self.update(x)
+        return self.values[0][0]
+
+    def inequality_constraint(self,x):
+        self.update(x)
+        return self.values[1]
+
+    def equality_constraint(self,x):
+        self.update(x)
+        return self.values[2]
+
+    def objective_gradient(self,x):
+        self.update(x)
+        return self.gradients[0][0]
+
+    def inequality_jacobian(self,x):
+        self.update(x)
+        return self.gradients[1]
+
+    def equality_jacobian(self,x):
+        self.update(x)
+        return self.gradients[2]
+
+# ----------------------------------------------------------------------
+#   SLSQP with Parallel Gradients
+# ----------------------------------------------------------------------
+
+def SciPy_Solve(problem,number_of_workers=None,sense_step=1.4901161193847656e-08,iter=200,tolerance=1e-6):
+    """Solve the problem with SLSQP, computing the finite difference gradients in a process pool.
+
+    The inputs are scaled and bounded the same way as SUAVE's scipy_setup. Returns the scaled
+    optimum, which can be passed back to problem.evaluate to update the results.
+    """
+
+    inp = problem.optimization_problem.inputs
+
+    # Scale the initials and bounds
+    scl  = inp[:,4].astype(float)
+    x    = inp[:,1].astype(float)/scl
+    bnds = np.vstack([inp[:,2].astype(float)/scl,inp[:,3].astype(float)/scl]).T
+
+    with make_pool(problem,number_of_workers) as pool:
+        fd = Parallel_Finite_Difference(pool,sense_step)
+
+        # skip the constraint sets that are empty for this problem
+        fd.update(x)
+        kwargs = dict()
+        if len(fd.values[1]):
+            kwargs['f_ieqcons']      = fd.inequality_constraint
+            kwargs['fprime_ieqcons'] = fd.inequality_jacobian
+        if len(fd.values[2]):
+            kwargs['f_eqcons']       = fd.equality_constraint
+            kwargs['fprime_eqcons']  = fd.equality_jacobian
+
+        outputs = sp.optimize.fmin_slsqp(fd.objective,x,fprime=fd.objective_gradient,bounds=bnds,
+                                         iter=iter,acc=tolerance,**kwargs)
+
+    return outputs
@@ -2,6 +2,7 @@
 # 
 # Created:  Mar 2016, M. Vegh
 # Modified: Aug 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -17,7 +18,12 @@ from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Propulsion.compute_tur
 #from SUAVE.Methods.Center_of_Gravity.compute_component_centers_of_gravity import compute_component_centers_of_gravity
 #from SUAVE.Methods.Center_of_Gravity.compute_aircraft_center_of_gravity import compute_aircraft_center_of_gravity
 from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff import compute_max_lift_coeff
-from SUAVE.Optimization.write_optimization_outputs import write_optimization_outputs
+
+from Tracked_Process import Tracked_Process
+from Weight_Cache import evaluate_weights
+from Output_Writer import Output_Writer
+from Warm_Start import Warm_Start
+from Atmosphere_Table import US_Standard_1976_Table
 
 # ----------------------------------------------------------------------        
 #   Setup
@@ -29,21 +35,51 @@ def setup():
     #   Analysis Procedure
     # ------------------------------------------------------------------ 
     
-    # size the base config
-    procedure = Process()
-    procedure.simple_sizing = simple_sizing
+    # Each step lists the paths it reads and writes, so an evaluation only reruns the
+    # steps downstream of the inputs that changed
+    tracked = Tracked_Process()
+    
+    # size the wings, from the inputs wing_planform reads
+    tracked.append('wing_sizing', wing_sizing,
+                   reads  = ['vehicle_configurations.*.wings.*.areas.reference',
+                             'vehicle_configurations.*.wings.*.aspect_ratio',
+                             'vehicle_configurations.*.wings.*.taper',
+                             'vehicle_configurations.*.wings.*.sweeps.quarter_chord',
+                             'vehicle_configurations.*.wings.*.thickness_to_chord',
+                             'vehicle_configurations.*.wings.*.dihedral',
+                             'vehicle_configurations.*.wings.*.origin',
+                             'vehicle_configurations.*.wings.*.vertical',
+                             'vehicle_configurations.*.wings.*.symmetric'],
+                   writes = ['vehicle_configurations.*.wings'])
+    
+    # size the engines and pressurize the fuselage for the cruise altitude
+    tracked.append('engine_sizing', engine_sizing,
+                   reads  = ['missions.base.segments.climb_5.altitude_end',
+                             'missions.base.segments.cruise.air_speed'],
+                   writes = ['vehicle_configurations.*.fuselages',
+                             'vehicle_configurations.*.networks',
+                             'vehicle_configurations.*.nacelles'])
     
-    # find the weights
-    procedure.weights = weight
-    # finalizes the data dependencies
-    procedure.finalize = finalize
+    # find the weights, the correlations read most of the vehicle so every value in it is compared
+    tracked.append('weights', weight,
+                   reads  = ['vehicle_configurations'],
+                   writes = ['vehicle_configurations'])
+    
+    # finalizes the data dependencies, the aerodynamic surrogates only see the wings
+    tracked.append('finalize', finalize,
+                   reads  = ['vehicle_configurations.*.wings'],
+                   writes = ['analyses'])
     
     # performance studies
-    procedure.missions                   = Process()
-    procedure.missions.design_mission    = design_mission
+    missions                   = Process()
+    missions.design_mission    = design_mission
+    tracked.append('missions', missions)
 
     # post process the results
-    procedure.post_process = post_process
+    tracked.append('post_process', post_process)
+    
+    procedure = Process()
+    procedure.tracked = tracked
         
     return procedure
 
@@ -53,42 +89,139 @@ def setup():
 
 def find_target_range(nexus,mission):
     
-    segments = mission.segments
-    climb_1  = segments['climb_1']
-    climb_2  = segments['climb_2']
-    climb_3  = segments['climb_3']
-    climb_4  = segments['climb_4']
-    climb_5  = segments['climb_5']
-  
-    descent_1 = segments['descent_1']
-    descent_2 = segments['descent_2']
-    descent_3 = segments['descent_3']
-
-    x_climb_1   = climb_1.altitude_end/np.tan(np.arcsin(climb_1.climb_rate/climb_1.air_speed))
-    x_climb_2   = (climb_2.altitude_end-climb_1.altitude_end)/np.tan(np.arcsin(climb_2.climb_rate/climb_2.air_speed))
-    x_climb_3   = (climb_3.altitude_end-climb_2.altitude_end)/np.tan(np.arcsin(climb_3.climb_rate/climb_3.air_speed))
-    x_climb_4   = (climb_4.altitude_end-climb_3.altitude_end)/np.tan(np.arcsin(climb_4.climb_rate/climb_4.air_speed))
-    x_climb_5   = (climb_5.altitude_end-climb_4.altitude_end)/np.tan(np.arcsin(climb_5.climb_rate/climb_5.air_speed))
-    x_descent_1 = (climb_5.altitude_end-descent_1.altitude_end)/np.tan(np.arcsin(descent_1.descent_rate/descent_1.air_speed))
-    x_descent_2 = (descent_1.altitude_end-descent_2.altitude_end)/np.tan(np.arcsin(descent_2.descent_rate/descent_2.air_speed))
-    x_descent_3 = (descent_2.altitude_end-descent_3.altitude_end)/np.tan(np.arcsin(descent_3.descent_rate/descent_3.air_speed))
-    
-    cruise_range = mission.design_range-(x_climb_1+x_climb_2+x_climb_3+x_climb_4+x_climb_5+x_descent_1+x_descent_2+x_descent_3)
+    # the design range ends at the last descent, the reserve segments come after it
+    cruise_range = target_cruise_ranges(mission, 'cruise', 'descent_3')
   
-    segments['cruise'].distance = cruise_range
+    mission.segments['cruise'].distance = cruise_range[0]
     
     return nexus
 
+def target_cruise_ranges(mission,cruise_tag='cruise',last_tag=None,cruise_altitudes=None,number_of_nodes=16):
+    """Find the cruise distance that makes the segments up to last_tag cover mission.design_range.
+    
+    Works for any Sequential_Segments mission. Constant rate climbs and descents contribute
+    their ground distance, with the speed set as an air speed or a Mach number, constant or
+    linear from start to end. Mach numbers are turned into speeds with the atmosphere at the
+    segment altitudes, and the ground distance is integrated over altitude with number_of_nodes
+    Gauss points. Other segments must have a set distance. Any other segment raises a
+    ValueError, as its distance can not be known before the mission is solved.
+    All of the climbs and descents are computed together, and cruise_altitudes can be an
+    array of candidate cruise altitudes to get the cruise distance for each in one pass.
+    Returns an array of cruise distances, one per cruise altitude.
+    """
+    
+    segments = mission.segments
+    tags     = list(segments.keys())
+    if last_tag is not None:
+        tags = tags[:tags.index(last_tag)+1]
+    i_cruise = tags.index(cruise_tag)
+    
+    # walk the segments, carrying the altitude forward. A None altitude is the cruise altitude.
+    altitude       = 0.
+    starts         = []
+    ends           = []
+    rates          = []
+    speeds         = []
+    machs          = []
+    deviations     = []
+    fixed_distance = 0.
+    for ii, tag in enumerate(tags):
+        segment = segments[tag]
+        
+        start = segment.get('altitude_start',None)
+        if start is None:
+            start = altitude
+        end = segment.get('altitude_end',None)
+        if end is None:
+            end = start
+        if ii == i_cruise - 1 and cruise_altitudes is not None:
+            end = None
+        altitude = end
+        
+        if ii == i_cruise:
+            continue
+        
+        rate = segment.get('climb_rate',None)
+        if rate is None:
+            rate = segment.get('descent_rate',None)
+        
+        if rate is not None:
+            speed = speed_profile(segment,'air_speed')
+            mach  = speed_profile(segment,'mach')
+            if speed is None and mach is None:
+                raise ValueError('target_cruise_ranges: segment ' + tag + ' (' + type(segment).__name__ + ') has a rate but no air speed or Mach number')
+            starts.append(start)
+            ends.append(end)
+            rates.append(rate)
+            speeds.append([0.,0.] if speed is None else speed)
+            machs.append([0.,0.] if mach is None else mach)
+            deviations.append(segment.get('temperature_deviation',0.))
+        elif segment.get('distance',None) is not None:
+            fixed_distance += segment.distance
+        else:
+            raise ValueError('target_cruise_ranges: the ground distance of segment ' + tag + ' (' + type(segment).__name__ + ') is only known once the mission is solved')
+    
+    if cruise_altitudes is None:
+        cruise_altitudes = np.array([np.nan])
+    cruise_altitudes = np.atleast_1d(np.asarray(cruise_altitudes,dtype=float))
+    if not rates:
+        return mission.design_range - fixed_distance + np.zeros_like(cruise_altitudes)
+    
+    # the altitudes of every climb and descent for every cruise altitude
+    cruise_altitudes = cruise_altitudes[:,None]
+    starts = np.array([np.nan if h is None else h for h in starts],dtype=float)[None,:]
+    ends   = np.array([np.nan if h is None else h for h in ends],dtype=float)[None,:]
+    starts = np.where(np.isnan(starts),cruise_altitudes,starts)
+    ends   = np.where(np.isnan(ends),cruise_altitudes,ends)
+    
+    # Gauss points along every segment, the speed and Mach number are linear in altitude at a constant rate
+    nodes, weights = np.polynomial.legendre.leggauss(number_of_nodes)
+    fractions      = (nodes + 1.)/2.
+    altitudes      = starts[:,:,None] + (ends - starts)[:,:,None]*fractions
+    
+    speeds     = np.array(speeds,dtype=float)
+    machs      = np.array(machs,dtype=float)
+    rates      = np.array(rates,dtype=float)[None,:,None]
+    deviations = np.array(deviations,dtype=float)[None,:,None]*np.ones_like(altitudes)
+    
+    speed = speeds[:,0,None] + (speeds[:,1] - speeds[:,0])[:,None]*fractions
+    mach  = machs[:,0,None]  + (machs[:,1] - machs[:,0])[:,None]*fractions
+    if np.any(machs):
+        freestream = atmosphere.compute_values(altitudes.reshape(-1,1),deviations.reshape(-1,1))
+        speed      = speed + mach*np.reshape(freestream.speed_of_sound,altitudes.shape)
+    
+    # ground distance per altitude is the cotangent of the flight path angle
+    horizontal = np.abs(ends - starts)/2.*np.sum(weights*np.sqrt(speed**2 - rates**2)/rates,axis=2)
+    
+    return mission.design_range - fixed_distance - np.sum(horizontal,axis=1)
+
+def speed_profile(segment,name):
+    """The start and end value of a constant or linear speed or Mach number, or None."""
+    
+    value = segment.get(name,None)
+    if value is not None:
+        return [value,value]
+    
+    start = segment.get(name + '_start',None)
+    end   = segment.get(name + '_end',None)
+    if start is not None and end is not None:
+        return [start,end]
+    
+    return None
+
 # ----------------------------------------------------------------------        
 #   Design Mission
 # ----------------------------------------------------------------------    
+# the segments start from the unknowns of the last converged solve, set enabled to False to use the defaults
+warm_start = Warm_Start()
+
 def design_mission(nexus):
     
     mission = nexus.missions.base
     mission.design_range = 1500.*Units.nautical_miles
     find_target_range(nexus,mission)
     results = nexus.results
-    results.base = mission.evaluate()
+    results.base = warm_start.evaluate(mission)
     
     return nexus
 
@@ -96,14 +229,30 @@ def design_mission(nexus):
 #   Sizing
 # ----------------------------------------------------------------------    
 
-def simple_sizing(nexus):
+def wing_sizing(nexus):
+    configs=nexus.vehicle_configurations
+    
+    for config in configs:
+        config.wings.horizontal_stabilizer.areas.reference = (26.0/92.0)*config.wings.main_wing.areas.reference
+            
+        for wing in config.wings:
+            
+            wing = SUAVE.Methods.Geometry.Two_Dimensional.Planform.wing_planform(wing)
+            wing.areas.exposed  = 0.8 * wing.areas.wetted
+            wing.areas.affected = 0.6 * wing.areas.reference
+
+    return nexus
+
+# the atmosphere is tabulated once, then every sizing call only interpolates
+atmosphere = US_Standard_1976_Table()
+
+def engine_sizing(nexus):
     configs=nexus.vehicle_configurations
     base=configs.base
     
     #find conditions
     air_speed   = nexus.missions.base.segments['cruise'].air_speed 
     altitude    = nexus.missions.base.segments['climb_5'].altitude_end
-    atmosphere  = SUAVE.Analyses.Atmospheric.US_Standard_1976()
     
     freestream  = atmosphere.compute_values(altitude)
     freestream0 = atmosphere.compute_values(6000.*Units.ft)  #cabin altitude
@@ -124,14 +273,6 @@ def simple_sizing(nexus):
     conditions.freestream  = freestream
     
     for config in configs:
-        config.wings.horizontal_stabilizer.areas.reference = (26.0/92.0)*config.wings.main_wing.areas.reference
-            
-        for wing in config.wings:
-            
-            wing = SUAVE.Methods.Geometry.Two_Dimensional.Planform.wing_planform(wing)
-            wing.areas.exposed  = 0.8 * wing.areas.wetted
-            wing.areas.affected = 0.6 * wing.areas.reference
-            
         fuselage              = config.fuselages['fuselage']
         fuselage.differential_pressure = diff_pressure 
         
@@ -147,13 +288,10 @@ def simple_sizing(nexus):
 def weight(nexus):
     vehicle=nexus.vehicle_configurations.base
 
-    # weight analysis
-    weights = nexus.analyses.base.weights.evaluate(method="SUAVE")
-    weights = nexus.analyses.cruise.weights.evaluate(method="SUAVE")
-    vehicle.mass_properties.breakdown = weights
-    weights = nexus.analyses.landing.weights.evaluate(method="SUAVE")
-    weights = nexus.analyses.takeoff.weights.evaluate(method="SUAVE")
-    weights = nexus.analyses.short_field_takeoff.weights.evaluate(method="SUAVE")
+    # weight analysis, configurations that match one already evaluated reuse its results
+    tags       = ['base','cruise','landing','takeoff','short_field_takeoff']
+    breakdowns = evaluate_weights(nexus.analyses, tags, method="SUAVE")
+    vehicle.mass_properties.breakdown = breakdowns.cruise
 
     return nexus
 
@@ -171,6 +309,9 @@ def finalize(nexus):
 #   Post Process Results to give back to the optimizer
 # ----------------------------------------------------------------------   
 
+# iteration records are written to .npz chunks in this directory, read them with Output_Writer.read_outputs
+output_writer = Output_Writer('optimization_outputs')
+
 def post_process(nexus):
     
     # Unpack data
@@ -196,8 +337,7 @@ def post_process(nexus):
     summary.max_zero_fuel_margin  = (design_landing_weight - zero_fuel_weight)/zero_fuel_weight
     summary.base_mission_fuelburn = design_takeoff_weight - results.base.segments['descent_3'].conditions.weights.total_mass[-1]
     
-    #when you run want to output results to a file
-    filename = 'results.txt'
-    write_optimization_outputs(nexus, filename)
+    #when you run want to output results to a file, this is batched and written off the hot path
+    output_writer.write(nexus)
    
     return nexus    
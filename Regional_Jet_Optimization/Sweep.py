@@ -0,0 +1,139 @@
+# Sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+from concurrent.futures import wait, FIRST_COMPLETED
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+import Parallel
+from Cache import problem_hash
+
+# ----------------------------------------------------------------------
+#   Carpet Sweep
+# ----------------------------------------------------------------------
+
+def carpet_sweep(problem,number_of_points,filename='sweep_results.txt',number_of_workers=None):
+    """Evaluate a carpet plot grid over the first two inputs in a process pool.
+
+    Every finished point is appended to the results file as soon as it returns, and points
+    already in the file are skipped, so a crashed sweep picks up where it stopped. Only a
+    bounded number of points is in flight at once. The outputs match SUAVE's carpet_plot.
+    """
+
+    opt_prob = problem.optimization_problem
+    inp      = opt_prob.inputs
+    obj      = opt_prob.objective
+    con      = opt_prob.constraints
+
+    # the grid in the units of the inputs
+    inputs      = np.zeros((2,number_of_points))
+    inputs[0,:] = np.linspace(inp[0,2],inp[0,3],number_of_points)
+    inputs[1,:] = np.linspace(inp[1,2],inp[1,3],number_of_points)
+
+    # everything except the first two inputs stays at its initial value
+    x0 = inp[:,1].astype(float)/inp[:,4].astype(float)
+
+    # a file left by a sweep of another problem, other bounds or other fixed inputs is started over
+    sha = hashlib.sha1(problem_hash(opt_prob).encode())
+    sha.update(x0[2:].tobytes())
+    header = '# carpet sweep ' + ' '.join([str(tag) for tag in inp[:2,0]]) + ' ' + str(number_of_points) + ' ' + sha.hexdigest()
+    length = 5 + len(con)
+    done   = read_sweep_results(filename,header,length)
+
+    # open the results file, writing the header for a new sweep
+    new_file = not os.path.isfile(filename) or not done
+    results  = open(filename,'w' if new_file else 'a')
+    if new_file:
+        results.write(header + '\n')
+        results.flush()
+    elif not ends_with_newline(filename):
+        # end a line cut short by a crash, it was skipped when reading
+        results.write('\n')
+
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count()
+
+    remaining = [(i,j) for j in range(number_of_points) for i in range(number_of_points) if (i,j) not in done]
+
+    with Parallel.make_pool(problem,number_of_workers) as pool:
+        max_in_flight = 4*number_of_workers
+        running       = dict()
+
+        while remaining or running:
+
+            # keep the pool busy without queuing the whole grid
+            while remaining and len(running) < max_in_flight:
+                i,j  = remaining.pop()
+                x    = x0*1.0
+                x[0] = inputs[0,i]/inp[0,4]
+                x[1] = inputs[1,j]/inp[1,4]
+                running[pool.submit(Parallel.evaluate_sweep_point,x)] = (i,j)
+
+            finished, _ = wait(running,return_when=FIRST_COMPLETED)
+            for future in finished:
+                i,j = running.pop(future)
+                objective, constraints = future.result()
+                line = [i,j,inputs[0,i],inputs[1,j]] + list(objective) + list(constraints)
+                results.write(' '.join([repr(float(value)) for value in line]) + '\n')
+                results.flush()
+
+    results.close()
+
+    # assemble the grids from the file in the layout of carpet_plot
+    done           = read_sweep_results(filename,header,length)
+    objective      = np.zeros((number_of_points,number_of_points))
+    constraint_val = np.zeros((len(con),number_of_points,number_of_points))
+    for (i,j), values in done.items():
+        objective[j,i]        = values[0]*obj[0,1]
+        constraint_val[:,j,i] = values[1:]*con[:,3].astype(float)
+
+    outputs                = Data()
+    outputs.inputs         = inputs
+    outputs.objective      = objective
+    outputs.constraint_val = constraint_val
+
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Read Sweep Results
+# ----------------------------------------------------------------------
+
+def ends_with_newline(filename):
+
+    with open(filename,'rb') as f:
+        f.seek(-1,os.SEEK_END)
+        return f.read(1) == b'\n'
+
+def read_sweep_results(filename,header,number_of_values):
+    """Read the finished points of a sweep, keyed by grid index. A file for a different sweep is ignored."""
+
+    done = dict()
+    if not os.path.isfile(filename):
+        return done
+
+    with open(filename,'r') as f:
+        if f.readline().strip() != header:
+            return done
+
+        # lines cut short by a crash are skipped
+        for line in f:
+            values = line.split()
+            try:
+                values = [float(value) for value in values]
+            except ValueError:
+                continue
+            if len(values) != number_of_values:
+                continue
+            done[(int(values[0]),int(values[1]))] = np.array(values[4:])
+
+    return done
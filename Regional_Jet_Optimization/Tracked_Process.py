@@ -0,0 +1,162 @@
+# Tracked_Process.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Tracked Process
+# ----------------------------------------------------------------------
+
+class Tracked_Process(object):
+    """A procedure that only reruns the steps affected by what changed since the last evaluation.
+
+    Each step lists the data paths it reads and writes, in the same dotted form as the
+    optimization aliases ('vehicle_configurations.*.wings.main_wing.areas.reference').
+    A step reruns when one of the values it reads has changed, or when a step before it
+    that reran writes a path it reads. A path that points to a Data compares every number,
+    array and string below it, so a step can read a whole configuration when its real
+    inputs are too many to list. Steps that read None always run.
+    """
+
+    def __init__(self):
+        self.steps     = []
+        self.snapshots = dict()
+        self.last_run  = []
+
+    def append(self,tag,step,reads=None,writes=()):
+
+        self.steps.append([tag,step,reads,list(writes)])
+
+        return
+
+    def evaluate(self,nexus):
+
+        written       = []
+        self.last_run = []
+
+        for tag, step, reads, writes in self.steps:
+
+            if reads is None:
+                run = True
+            else:
+                snapshot = take_snapshot(nexus,reads)
+                run      = tag not in self.snapshots or not snapshots_equal(snapshot,self.snapshots[tag])
+                run      = run or any([paths_overlap(read,write) for read in reads for write in written])
+
+            if not run:
+                continue
+
+            # the steps work on the nexus in place
+            if hasattr(step,'evaluate'):
+                step.evaluate(nexus)
+            else:
+                step(nexus)
+
+            # the snapshot is taken before the step runs, as the step may write to what it reads
+            if reads is not None:
+                self.snapshots[tag] = snapshot
+
+            written.extend(writes)
+            self.last_run.append(tag)
+
+        return nexus
+
+    def reset(self):
+        """Forget all of the snapshots, so the next evaluation runs every step."""
+
+        self.snapshots = dict()
+
+        return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def get_path(data,path):
+    """Return the values at a dotted path, where '*' matches every item at that level."""
+
+    values = [data]
+    for key in path.split('.'):
+        new_values = []
+        for value in values:
+            if key == '*':
+                new_values.extend(list(value.values()))
+            else:
+                new_values.append(value[key])
+        values = new_values
+
+    return values
+
+def take_snapshot(nexus,paths):
+
+    snapshot = dict()
+    for path in paths:
+        values = []
+        for value in get_path(nexus,path):
+            if isinstance(value,dict):
+                values.append(dict(data_leaves(value,set())))
+            else:
+                values.append(deepcopy(value))
+        snapshot[path] = values
+
+    return snapshot
+
+def data_leaves(data,visited):
+    """The keys and copies of the numbers, arrays and strings below a Data, in a stable order.
+
+    Private keys are skipped, the diffed configurations keep their base vehicle there.
+    """
+
+    if id(data) in visited:
+        return []
+    visited.add(id(data))
+
+    leaves = []
+    for key in sorted(data.keys()):
+        if key.startswith('_'):
+            continue
+        value = data[key]
+        if isinstance(value,dict):
+            leaves.extend((key + '.' + name,leaf) for name,leaf in data_leaves(value,visited))
+        elif isinstance(value,(bool,int,float,complex,str,np.number,np.ndarray)):
+            leaves.append((key,deepcopy(value)))
+
+    return leaves
+
+def snapshots_equal(new,old):
+
+    if set(new.keys()) != set(old.keys()):
+        return False
+
+    for path in new.keys():
+        if len(new[path]) != len(old[path]):
+            return False
+        for a,b in zip(new[path],old[path]):
+            if isinstance(a,dict) != isinstance(b,dict):
+                return False
+            if isinstance(a,dict):
+                if set(a.keys()) != set(b.keys()):
+                    return False
+                if not all([np.array_equal(np.asarray(a[key]),np.asarray(b[key])) for key in a.keys()]):
+                    return False
+            elif not np.array_equal(np.asarray(a),np.asarray(b)):
+                return False
+
+    return True
+
+def paths_overlap(a,b):
+    """Check if one path contains the other, with '*' matching any key."""
+
+    for key_a,key_b in zip(a.split('.'),b.split('.')):
+        if key_a != key_b and key_a != '*' and key_b != '*':
+            return False
+
+    return True
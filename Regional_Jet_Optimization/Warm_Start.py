@@ -0,0 +1,79 @@
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#   Warm Start
+# ----------------------------------------------------------------------
+
+class Warm_Start(object):
+    """Start each mission solve from the unknowns that converged in the previous solve.
+
+    Consecutive optimizer iterates differ only slightly, so the converged throttle and body
+    angle of every segment are a much better guess than the defaults. If any segment fails
+    to converge from the warm start, the mission is solved again from the defaults.
+    """
+
+    def __init__(self,enabled=True):
+        self.enabled   = enabled
+        self.defaults  = None
+        self.converged = None
+
+    def evaluate(self,mission):
+
+        if not self.enabled:
+            return mission.evaluate()
+
+        if self.defaults is None:
+            self.defaults = Data()
+            for tag,segment in mission.segments.items():
+                self.defaults[tag] = deepcopy(segment.state.unknowns)
+
+        if self.converged is not None:
+            set_unknowns(mission,self.converged)
+            results = mission.evaluate()
+            if not all_converged(results):
+                set_unknowns(mission,self.defaults)
+                results = mission.evaluate()
+        else:
+            results = mission.evaluate()
+
+        # only keep a solution that converged
+        if all_converged(results):
+            self.converged = Data()
+            for tag,segment in results.segments.items():
+                self.converged[tag] = deepcopy(segment.unknowns)
+        else:
+            self.converged = None
+
+        return results
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def set_unknowns(mission,unknowns):
+
+    for tag,segment in mission.segments.items():
+        if tag in unknowns:
+            for key,value in unknowns[tag].items():
+                segment.state.unknowns[key] = deepcopy(value)
+
+    return
+
+def all_converged(results):
+
+    for segment in results.segments.values():
+        if not segment.numerics.get('converged',True):
+            return False
+
+    return True
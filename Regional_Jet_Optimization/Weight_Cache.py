@@ -0,0 +1,149 @@
+# Weight_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import hashlib
+from copy import deepcopy
+from collections import OrderedDict
+
+from SUAVE.Core import Data
+
+from Cache_Tools import update_hash
+
+# ----------------------------------------------------------------------
+#   Weights Evaluation
+# ----------------------------------------------------------------------
+
+# weight results of this process, keyed by configuration fingerprint
+_store          = OrderedDict()
+_max_store_size = 64
+
+# evaluations saved by the store
+statistics = Data()
+statistics.hits   = 0
+statistics.misses = 0
+
+# keys the weight correlations never read: names, high lift and control surface settings,
+# low speed aerodynamics, and the breakdown the evaluation writes
+excluded_keys = ['tag','deflection','maximum_lift_coefficient','V2_VS_ratio','Vref_VS_ratio','weight_breakdown']
+
+# mass properties of the whole vehicle the evaluation writes, every other mass_properties
+# below the vehicle holds the mass of a component and is written by the evaluation too
+excluded_mass_properties = ['breakdown','operating_empty']
+
+def evaluate_weights(analyses,tags,method='SUAVE'):
+    """Evaluate the weights of several configurations, evaluating each distinct configuration once.
+
+    Every configuration is fingerprinted on the inputs of the weight correlations before it is
+    evaluated. The configurations of one vehicle differ in their flap and slat settings and in
+    their tags, which the correlations do not read, so they share a fingerprint and only the
+    first one is evaluated. The others, and any later iteration back at the same inputs, get the
+    stored breakdown and mass properties instead. Returns the breakdowns by tag.
+    """
+
+    breakdowns = Data()
+
+    for tag in tags:
+        weights     = analyses[tag].weights
+        vehicle     = weights.vehicle
+        fingerprint = configuration_fingerprint(vehicle)
+
+        if fingerprint in _store:
+            apply_weights(vehicle,_store[fingerprint])
+            _store.move_to_end(fingerprint)
+            statistics.hits += 1
+        else:
+            breakdown = weights.evaluate(method=method)
+            _store[fingerprint] = take_weights(vehicle,breakdown)
+            while len(_store) > _max_store_size:
+                _store.popitem(last=False)
+            statistics.misses += 1
+
+        breakdowns[tag] = deepcopy(_store[fingerprint].weight_breakdown)
+
+    return breakdowns
+
+def hit_rate():
+    """The fraction of configurations that reused a stored evaluation."""
+
+    total = statistics.hits + statistics.misses
+
+    return statistics.hits / total if total else 0.
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def configuration_fingerprint(vehicle):
+
+    sha = hashlib.sha1()
+    hash_inputs(sha,vehicle,True)
+
+    return sha.hexdigest()
+
+def hash_inputs(sha,data,is_vehicle=False):
+
+    for key in sorted(data.keys()):
+
+        # the diffed configurations keep their base vehicle in private keys
+        if key in excluded_keys or key.startswith('_'):
+            continue
+
+        value = data[key]
+        if key == 'mass_properties' and not is_vehicle:
+            continue
+        if key == 'mass_properties':
+            value = Data(value)
+            for output in excluded_mass_properties:
+                value.pop(output,None)
+
+        sha.update(str(key).encode())
+        if isinstance(value,dict):
+            hash_inputs(sha,value)
+        else:
+            update_hash(sha,value)
+
+    return
+
+def take_weights(vehicle,breakdown):
+    """Copy everything a weights evaluation writes: the breakdown and every mass_properties."""
+
+    stored = Data()
+    stored.weight_breakdown = deepcopy(breakdown)
+    stored.mass_properties  = []
+    for path, mass_properties in find_mass_properties(vehicle,[]):
+        if path == ['mass_properties']:
+            mass_properties = Data(mass_properties)
+            mass_properties.pop('breakdown',None)
+        stored.mass_properties.append([path,deepcopy(mass_properties)])
+
+    return stored
+
+def apply_weights(vehicle,stored):
+
+    vehicle.weight_breakdown = deepcopy(stored.weight_breakdown)
+    for path, mass_properties in stored.mass_properties:
+        data = vehicle
+        for key in path[:-1]:
+            data = data[key]
+        data[path[-1]].update(deepcopy(mass_properties))
+
+    return
+
+def find_mass_properties(data,path):
+
+    found = []
+    for key, value in data.items():
+        if not isinstance(value,dict) or key.startswith('_'):
+            continue
+        if key == 'mass_properties':
+            found.append([path + [key],value])
+        else:
+            found.extend(find_mass_properties(value,path + [key]))
+
+    return found
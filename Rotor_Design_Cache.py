@@ -0,0 +1,63 @@
+# Rotor_Design_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+
+import SUAVE
+from SUAVE.Methods.Propulsion import propeller_design
+
+from Cache_Tools import update_hash, save_pickle, load_pickle
+
+# ----------------------------------------------------------------------
+#   Cached Propeller Design
+# ----------------------------------------------------------------------
+
+def cached_propeller_design(prop,number_of_stations=20,cache_directory='rotor_design_cache'):
+    """propeller_design, with the designed rotor stored under a hash of its definition.
+
+    The hash covers everything set on the rotor before the design (radii, blade count,
+    design thrust or power, altitude, speeds, airfoil files...), the contents of the airfoil
+    files, the number of stations and the SUAVE version. While none of these change the
+    designed rotor, with its chord and twist distributions, is read back from the cache.
+    """
+
+    fingerprint = design_fingerprint(prop,number_of_stations)
+    filename    = os.path.join(cache_directory,fingerprint + '.pkl')
+
+    designed = load_pickle(filename)
+    if designed is not None:
+        return designed
+
+    prop = propeller_design(prop,number_of_stations)
+    save_pickle(filename,prop)
+
+    return prop
+
+# ----------------------------------------------------------------------
+#   Fingerprints
+# ----------------------------------------------------------------------
+
+def design_fingerprint(prop,number_of_stations):
+
+    sha = hashlib.sha1()
+    sha.update(SUAVE.__version__.encode())
+    sha.update(type(prop).__name__.encode())
+    sha.update(str(number_of_stations).encode())
+    update_hash(sha,prop)
+
+    # the airfoils are hashed by content, so an edited polar designs a new rotor
+    airfoil_files = list(prop.get('airfoil_geometry',None) or [])
+    for polar_files in prop.get('airfoil_polars',None) or []:
+        airfoil_files.extend(polar_files)
+    for filename in airfoil_files:
+        with open(filename,'rb') as f:
+            sha.update(f.read())
+
+    return sha.hexdigest()
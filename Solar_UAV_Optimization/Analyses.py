@@ -1,7 +1,7 @@
 # Analyses.py
 # 
 # Created:  Feb 2015, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -11,13 +11,16 @@ import SUAVE
 from SUAVE.Core import Units
 import numpy as np
 
+import Surrogates
+
 # ----------------------------------------------------------------------        
 #   Setup Analyses
 # ----------------------------------------------------------------------  
 
 def setup(configs):
     
-    analyses = SUAVE.Analyses.Analysis.Container()
+    # finalizing this container reuses trained aerodynamic surrogates
+    analyses = Surrogates.Container()
     
     # build a base analysis for each config
     for tag,config in configs.items():
@@ -1,7 +1,7 @@
 # Optimize.py
 # 
 # Created:  Feb 2016, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -11,15 +11,19 @@ import SUAVE
 assert SUAVE.__version__=='2.5.2', 'These tutorials only work with the SUAVE 2.5.2 release'
 
 from SUAVE.Core import Units, Data
+import os
+import sys
 import numpy as np
+# the caching helpers, surrogates and multi-start driver are shared with the tutorials one folder up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir))
 import Vehicles
 import Analyses
 import Missions
 import Procedure
 import Plot_Mission
+import Prescreen
 import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
 import SUAVE.Optimization.Package_Setups.pyopt_setup as pyopt_setup
-from SUAVE.Optimization.Nexus import Nexus
 import pylab as plt
 
 
@@ -31,6 +35,11 @@ def main():
     problem = setup()
     output  = scipy_setup.SciPy_Solve(problem)
     
+    # Uncomment instead to solve from several Latin hypercube starting points in a process pool
+    #import Multi_Start
+    #results = Multi_Start.multi_start_solve(problem,8)
+    #output  = results[0].x
+    
     problem.translate(output)
 
     Plot_Mission.plot_mission(problem.results.mission)
@@ -43,7 +52,7 @@ def main():
 
 def setup():
 
-    nexus = Nexus()
+    nexus = Prescreen.Prescreened_Nexus()
     problem = Data()
     nexus.optimization_problem = problem
 
@@ -122,6 +131,12 @@ def setup():
     # -------------------------------------------------------------------    
     nexus.procedure = Procedure.setup()
     
+    # -------------------------------------------------------------------
+    #  Pre-screening
+    # -------------------------------------------------------------------
+    # Uncomment to skip the mission for designs a surrogate confidently marks as running out of energy
+    #nexus.energy_surrogate = Prescreen.Energy_Surrogate()
+    
     return nexus
 
 if __name__ == '__main__':
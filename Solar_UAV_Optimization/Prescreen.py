@@ -0,0 +1,189 @@
+# Prescreen.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+import scipy.linalg
+
+from SUAVE.Optimization.Nexus import Nexus
+
+# ----------------------------------------------------------------------
+#   Energy Surrogate
+# ----------------------------------------------------------------------
+
+class Energy_Surrogate(object):
+    """An online Gaussian process of the energy constraint over the scaled inputs.
+
+    The constraint is feasible at zero and grows as the battery runs out. A point is
+    confidently infeasible when the mean minus confidence standard deviations is still
+    above the margin. Nothing is screened until minimum_points designs have been solved.
+    """
+
+    def __init__(self,length_scale=0.5,noise=1e-6,confidence=3.0,margin=0.05,minimum_points=10,maximum_points=300):
+        self.length_scale   = length_scale
+        self.noise          = noise
+        self.confidence     = confidence
+        self.margin         = margin
+        self.minimum_points = minimum_points
+        self.maximum_points = maximum_points
+        self.X              = np.zeros((0,0))
+        self.y              = np.zeros(0)
+        self.summaries      = []
+        self.skipped        = 0
+
+    def add(self,x,energy_constraint,summary):
+
+        x = np.atleast_2d(np.asarray(x,dtype=float))
+        if len(self.y) == 0:
+            self.X = x
+        else:
+            self.X = np.vstack([self.X,x])
+        self.y = np.append(self.y,float(energy_constraint))
+        self.summaries.append(deepcopy(summary))
+
+        # only keep the most recent designs
+        self.X         = self.X[-self.maximum_points:]
+        self.y         = self.y[-self.maximum_points:]
+        self.summaries = self.summaries[-self.maximum_points:]
+
+        self._fit()
+
+        return
+
+    def predict(self,x):
+
+        x      = np.atleast_2d(np.asarray(x,dtype=float))
+        k      = self._kernel(x,self.X)
+        mean   = self.y_mean + self.y_std*(k @ self.alpha)
+        v      = scipy.linalg.solve_triangular(self.L,k.T,lower=True)
+        var    = np.maximum(1.0 - np.sum(v**2,axis=0),0.)
+        std    = self.y_std*np.sqrt(var)
+
+        return mean[0], std[0]
+
+    def confidently_infeasible(self,x):
+
+        if len(self.y) < self.minimum_points:
+            return False
+
+        mean, std = self.predict(x)
+
+        return mean - self.confidence*std > self.margin
+
+    def nearest_summary(self,x):
+
+        distance = np.sum((self.X - np.asarray(x,dtype=float))**2,axis=1)
+
+        return deepcopy(self.summaries[np.argmin(distance)])
+
+    def _fit(self):
+
+        # normalize the targets so one length scale and noise fit every problem
+        self.y_mean = np.mean(self.y)
+        self.y_std  = np.std(self.y) if np.std(self.y) > 0. else 1.0
+        y           = (self.y - self.y_mean)/self.y_std
+
+        K          = self._kernel(self.X,self.X) + self.noise*np.eye(len(y))
+        self.L     = np.linalg.cholesky(K)
+        self.alpha = scipy.linalg.cho_solve((self.L,True),y)
+
+        return
+
+    def _kernel(self,A,B):
+
+        distance = np.sum(A**2,axis=1)[:,None] + np.sum(B**2,axis=1)[None,:] - 2.*A @ B.T
+
+        return np.exp(-0.5*np.maximum(distance,0.)/self.length_scale**2)
+
+# ----------------------------------------------------------------------
+#   Prescreened Nexus
+# ----------------------------------------------------------------------
+
+class Prescreened_Nexus(Nexus):
+    """A Nexus that skips the mission for designs the energy surrogate marks as infeasible.
+
+    A skipped design gets the surrogate prediction of the energy constraint, and every other
+    constraint is pushed one scaling past its edge, as those values were never computed.
+    Only the entries the problem does not constrain, such as the objective, come from the
+    nearest solved design. Without an energy_surrogate it behaves like a plain Nexus.
+    """
+
+    def __defaults__(self):
+        self.energy_surrogate = None
+
+    def evaluate(self,x = None):
+
+        surrogate = self.energy_surrogate
+
+        if surrogate is None or x is None:
+            return Nexus.evaluate(self,x)
+
+        x = np.asarray(x,dtype=float)
+
+        if surrogate.confidently_infeasible(x):
+            mean, std = surrogate.predict(x)
+            self.unpack_inputs(x)
+            self.summary = surrogate.nearest_summary(x)
+            self.summary.energy_constraint = mean
+            self.screen_constraints()
+            surrogate.skipped += 1
+            return
+
+        Nexus.evaluate(self,x)
+
+        # the Nexus does not rerun its last design, whose summary a skip may have replaced
+        if len(surrogate.y) and np.array_equal(x,surrogate.X[-1]):
+            self.summary = deepcopy(surrogate.summaries[-1])
+        else:
+            surrogate.add(x,self.summary.energy_constraint,self.summary)
+
+        return
+
+    def screen_constraints(self):
+        """Set every constraint but the energy one to a value one scaling on the infeasible side."""
+
+        problem = self.optimization_problem
+        aliases = dict([(alias[0],alias[1]) for alias in problem.aliases])
+
+        for tag, sense, edge, scaling, units in problem.constraints:
+            paths = aliases[tag] if isinstance(aliases[tag],list) else [aliases[tag]]
+            if 'summary.energy_constraint' in paths:
+                continue
+
+            if sense == '<':
+                value = (edge + scaling)*units
+            else:
+                value = (edge - scaling)*units
+
+            # the battery mass lives on the vehicle, the procedure sets it again on the next solved design
+            for path in paths:
+                set_path(self,path,value)
+
+        return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def set_path(data,path,value):
+    """Set the value at a dotted path, where '*' matches every item at that level."""
+
+    keys    = path.split('.')
+    parents = [data]
+    for key in keys[:-1]:
+        if key == '*':
+            parents = [child for parent in parents for child in parent.values()]
+        else:
+            parents = [parent[key] for parent in parents]
+
+    for parent in parents:
+        parent[keys[-1]] = value
+
+    return
@@ -0,0 +1,143 @@
+# Surrogates.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+from copy import deepcopy
+from collections import OrderedDict
+
+import SUAVE
+
+from Cache_Tools import update_hash, save_pickle, load_pickle
+
+# ----------------------------------------------------------------------
+#   Surrogate Store
+# ----------------------------------------------------------------------
+
+# trained inviscid wing surrogates of this process, keyed by geometry fingerprint
+_store          = OrderedDict()
+_max_store_size = 32
+
+# sampled training data is also kept on disk, set to None to turn this off
+cache_directory = 'surrogate_cache'
+
+class Container(SUAVE.Analyses.Analysis.Container):
+    """An analyses container whose finalize goes through the surrogate store and disk cache."""
+
+    def finalize(self):
+        finalize_analyses(self)
+
+def finalize_analyses(analyses):
+    """Finalize the analyses of every configuration, reusing the trained aerodynamic surrogates.
+
+    A configuration whose wings have not changed since its last finalize keeps its surrogate,
+    and a configuration with the same wings as another one picks up that surrogate from the
+    store instead of retraining. The first time a configuration is seen, the training data
+    is read from the disk cache if it has been sampled before, and only the surrogate is built.
+    """
+
+    for config_analyses in analyses.values():
+        for tag,analysis in config_analyses.items():
+            if tag == 'aerodynamics':
+                finalize_aerodynamics(analysis)
+            elif hasattr(analysis,'finalize'):
+                analysis.finalize()
+
+    return analyses
+
+def finalize_aerodynamics(aerodynamics):
+
+    inviscid_wings = aerodynamics.process.compute.lift.inviscid_wings
+    fingerprint    = geometry_fingerprint(aerodynamics)
+    last           = aerodynamics.get('surrogate_fingerprint',None)
+
+    # unchanged geometry, keep the surrogate
+    if fingerprint == last:
+        return
+
+    # same wings as a surrogate that was already trained
+    if last is not None and fingerprint in _store:
+        training, surrogates      = _store[fingerprint]
+        inviscid_wings.geometry   = aerodynamics.geometry
+        inviscid_wings.training   = training
+        inviscid_wings.surrogates = surrogates
+        _store.move_to_end(fingerprint)
+        aerodynamics.surrogate_fingerprint = fingerprint
+        return
+
+    training = load_training(fingerprint)
+    if training is None:
+        aerodynamics.finalize()
+        save_training(fingerprint,inviscid_wings.training)
+    else:
+        finalize_with_training(aerodynamics,training)
+
+    _store[fingerprint] = (inviscid_wings.training,inviscid_wings.surrogates)
+    while len(_store) > _max_store_size:
+        _store.popitem(last=False)
+    aerodynamics.surrogate_fingerprint = fingerprint
+
+    return
+
+def finalize_with_training(aerodynamics,training):
+    """Finalize the aerodynamics with sampling replaced by the stored training data."""
+
+    inviscid_wings = aerodynamics.process.compute.lift.inviscid_wings
+    vortex_lattice = type(inviscid_wings)
+
+    def sample_training(self):
+        self.training = deepcopy(training)
+
+    original = vortex_lattice.sample_training
+    vortex_lattice.sample_training = sample_training
+    try:
+        aerodynamics.finalize()
+    finally:
+        vortex_lattice.sample_training = original
+
+    return
+
+# ----------------------------------------------------------------------
+#   Disk Cache
+# ----------------------------------------------------------------------
+
+def load_training(fingerprint):
+
+    if cache_directory is None:
+        return None
+
+    return load_pickle(os.path.join(cache_directory,fingerprint + '.pkl'))
+
+def save_training(fingerprint,training):
+
+    if cache_directory is None:
+        return
+
+    save_pickle(os.path.join(cache_directory,fingerprint + '.pkl'),training)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Fingerprints
+# ----------------------------------------------------------------------
+
+def geometry_fingerprint(aerodynamics):
+    """Hash everything the inviscid wing surrogate is trained on, including the vortex counts."""
+
+    geometry = aerodynamics.geometry
+    training = aerodynamics.process.compute.lift.inviscid_wings.training
+
+    sha = hashlib.sha1()
+    update_hash(sha,geometry.wings)
+    update_hash(sha,geometry.reference_area)
+    update_hash(sha,aerodynamics.settings)
+    update_hash(sha,training.angle_of_attack)
+    update_hash(sha,training.Mach)
+
+    return sha.hexdigest()
@@ -1,6 +1,7 @@
 # Cessna_172.py
 #
 # Created:  Feb 2022, E. Botero
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -17,6 +18,10 @@ from SUAVE.Methods.Propulsion import propeller_design
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform import segment_properties
 from SUAVE.Plots.Performance import *
 
+#import Airfoil_Polars
+#import Rotor_Design_Cache
+#import Adaptive_Segments
+
 #from SUAVE.Input_Output.OpenVSP import write
 
 # ----------------------------------------------------------------------
@@ -25,6 +30,9 @@ from SUAVE.Plots.Performance import *
 
 def main():   
      
+    # Uncomment to read the airfoil polars from a binary cache, compiled the first time they are seen
+    #Airfoil_Polars.use_polar_cache()
+    
     # Define internal combustion engine from Cessna Regression Aircraft 
     vehicle    = vehicle_setup()
 
@@ -36,6 +44,9 @@ def main():
     mission  = mission_setup(analyses,vehicle)
     
     # evaluate
+    # To refine the control points of each segment only until the fuel burn is resolved, uncomment this
+    # and remove mission.evaluate() below, evaluate_adaptive needs a mission that was not evaluated yet
+    #results, mission = Adaptive_Segments.evaluate_adaptive(mission)
     results = mission.evaluate()
     
     plot_mission(results)
@@ -340,6 +351,8 @@ def vehicle_setup():
 
     prop.airfoil_polar_stations  = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]      
     prop                         = propeller_design(prop)   
+    # Uncomment instead to read the designed propeller from the cache while its definition is unchanged
+    #prop                         = Rotor_Design_Cache.cached_propeller_design(prop)
     
     net.propellers.append(prop)
      
@@ -1,7 +1,7 @@
 # eVTOL_tutorial.py
 #
 # Created: Nov 2021, E. Botero
-#
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #   Imports
@@ -25,12 +25,19 @@ from SUAVE.Methods.Power.Battery.Sizing                  import initialize_from_
 
 from copy import deepcopy
 
+#import Mission_Profiler
+#import Airfoil_Polars
+#import Rotor_Design_Cache
+
 # ----------------------------------------------------------------------------------------------------------------------
 #   Main
 # ----------------------------------------------------------------------------------------------------------------------
 
 def main():
     
+    # Uncomment to read the airfoil polars from a binary cache, compiled the first time they are seen
+    #Airfoil_Polars.use_polar_cache()
+    
     # Setup a vehicle
     vehicle = setup_vehicle()
     
@@ -47,6 +54,9 @@ def main():
     # Evaluate the mission
     results = mission.evaluate()
     
+    # Uncomment instead to time every segment, written to mission_profile.json and mission_profile.folded
+    #results = Mission_Profiler.profile_mission(mission, 'mission_profile')
+    
     # plot the mission
     make_plots(results)
     
@@ -349,6 +359,12 @@ def setup_vehicle():
                                          './Airfoils/Polars/NACA_4412_polar_Re_1000000.txt' ]]    
     propeller.airfoil_polar_stations = np.zeros((20),dtype=np.int8).tolist()
     propeller                        = propeller_design(propeller)
+    # Uncomment instead to read the designed propeller from the cache while its definition is unchanged
+    #propeller                        = Rotor_Design_Cache.cached_propeller_design(propeller)
+    
+    # Uncomment to evaluate the blade sections from a regular (alpha, log Re) table of the polars
+    #propeller                        = Airfoil_Polars.use_polar_tables(propeller)
+    
     net.propellers.append(propeller)
     
     # The lift rotors
@@ -372,6 +388,11 @@ def setup_vehicle():
 
     lift_rotor.airfoil_polar_stations     = np.zeros((20),dtype=np.int8).tolist()
     lift_rotor                            = propeller_design(lift_rotor)    
+    # Uncomment instead to read the designed lift rotor from the cache while its definition is unchanged
+    #lift_rotor                            = Rotor_Design_Cache.cached_propeller_design(lift_rotor)
+    
+    # Uncomment to do the same for the lift rotors, which hover at many blade stations and control points
+    #lift_rotor                            = Airfoil_Polars.use_polar_tables(lift_rotor)
     
     # Appending rotors with different origins
     rotations = [1,-1,-1,1]
@@ -3,6 +3,7 @@
 # Created:  Aug 2014, SUAVE Team
 # Modified: Aug 2017, SUAVE Team
 #           Mar 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -38,6 +39,9 @@ from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
 
 from copy import deepcopy
 
+# Uncomment with the profiling lines in main to time every segment process step
+#import Mission_Profiler
+
 # ----------------------------------------------------------------------
 #   Main
 # ----------------------------------------------------------------------
@@ -64,6 +68,15 @@ def main():
     mission = analyses.missions.base
     results = mission.evaluate()
 
+    # To see where the mission spends its time, uncomment this instead. Every segment process step is
+    # timed, and a JSON report and a flamegraph trace are written to mission_profile.json/.folded
+    #results = Mission_Profiler.profile_mission(mission, 'mission_profile')
+
+    # With several missions in the container (short-range, long-range, reserve...), uncomment this to
+    # evaluate them all at once, each in its own worker process. The results keep the mission tags.
+    #import Parallel_Missions
+    #all_results = Parallel_Missions.evaluate_missions(analyses.missions)
+
     # Plot all mission results, including items such as altitude profile and L/D
     plot_mission(results)
 
@@ -3,6 +3,7 @@
 # Created:  Aug 2014, SUAVE Team
 # Modified: Apr 2016, T. Orra
 #           Aug 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -45,6 +46,13 @@ def main():
     reserves = 1750.
     payload_range_results = payload_range(config,mission,cruise_segment_tag,reserves)
 
+    # Uncomment to solve the points in parallel worker processes, with 10 intermediate payloads
+    # between each pair of corners. For a family of variants, pass the cruise_distance of the
+    # previous variant as initial_distances to warm start every point. The newton method converges
+    # each point in two or three mission evaluations.
+    #import Payload_Range
+    #payload_range_results = Payload_Range.payload_range(config,mission,cruise_segment_tag,reserves,number_of_intermediate=10,method='newton')
+
     # plot the results
     plot_mission(results)
 
@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2014, E. Botero
 # Modified: Aug 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -19,6 +20,9 @@ from SUAVE.Components.Energy.Networks.Solar import Solar
 from SUAVE.Methods.Propulsion import propeller_design
 from SUAVE.Methods.Power.Battery.Sizing import initialize_from_mass
 
+#import Rotor_Design_Cache
+#import Adaptive_Segments
+
 
 # ----------------------------------------------------------------------
 #   Main
@@ -37,6 +41,14 @@ def main():
     
     # mission analysis
     mission = analyses.missions.base
+    
+    # Uncomment to solve the segments with a colored sparse Jacobian, which the 64 point cruise benefits from
+    #import Colored_Jacobian
+    #mission = Colored_Jacobian.use_colored_jacobian(mission)
+    
+    # To refine the control points of each segment only until the battery energy is resolved, uncomment this
+    # and remove mission.evaluate() below, evaluate_adaptive needs a mission that was not evaluated yet
+    #results, mission = Adaptive_Segments.evaluate_adaptive(mission)
     results = mission.evaluate()
     
     # plot results    
@@ -243,6 +255,8 @@ def vehicle_setup():
     prop.design_power        = None
     prop.design_thrust       = 120.
     prop                     = propeller_design(prop)
+    # Uncomment instead to read the designed propeller from the cache while its definition is unchanged
+    #prop                     = Rotor_Design_Cache.cached_propeller_design(prop)
     
     net.propellers.append(prop)
 
@@ -1,7 +1,7 @@
 # QS_tutorial.py
 # 
 # Created:  Feb 2022, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -21,6 +21,8 @@ from SUAVE.Methods.Power.Battery.Sizing import initialize_from_mass
 from SUAVE.Methods.Propulsion.electric_motor_sizing import size_from_kv
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
 
+#import Rotor_Design_Cache
+
 # ----------------------------------------------------------------------
 #   Main
 # ----------------------------------------------------------------------
@@ -140,6 +142,8 @@ def vehicle_setup():
     prop.design_altitude     = 0.1 * Units.km
     prop.design_power        = 200. * Units.watts
     prop                     = propeller_design(prop)
+    # Uncomment instead to read the designed propeller from the cache while its definition is unchanged
+    #prop                     = Rotor_Design_Cache.cached_propeller_design(prop)
     
     origins = [[0., 0.15, -0.05], [0., -0.15, -0.05], [0., .35, 0.05], [0., 0.35, 0.05]]
     